@@ -0,0 +1,32 @@
+"""add reset token expiry index
+
+Revision ID: 3f9c2d71a8b4
+Revises: 65f85f6158fe
+Create Date: 2026-10-18 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2d71a8b4'
+down_revision: Union[str, None] = '65f85f6158fe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_password_reset_tokens_expires_at_unused',
+        'password_reset_tokens',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text('used = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_password_reset_tokens_expires_at_unused', table_name='password_reset_tokens')
@@ -0,0 +1,32 @@
+"""add user keyset index
+
+Revision ID: 8b1e4c0d2f57
+Revises: 3f9c2d71a8b4
+Create Date: 2026-10-18 10:03:27.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e4c0d2f57'
+down_revision: Union[str, None] = '3f9c2d71a8b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_created_at_id_alive',
+        'users',
+        ['created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_created_at_id_alive', table_name='users')
@@ -0,0 +1,44 @@
+"""add user search trgm indexes
+
+Revision ID: c47a9e13b6d2
+Revises: 8b1e4c0d2f57
+Create Date: 2026-10-18 10:41:09.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47a9e13b6d2'
+down_revision: Union[str, None] = '8b1e4c0d2f57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes let the user search's ILIKE '%term%' predicates
+    # use an index instead of scanning every row.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_users_email_trgm',
+        'users',
+        ['email'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_users_profile_name_trgm',
+        'users',
+        [sa.text("json_extract_path_text(profile, 'name') gin_trgm_ops")],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_profile_name_trgm', table_name='users')
+    op.drop_index('ix_users_email_trgm', table_name='users')
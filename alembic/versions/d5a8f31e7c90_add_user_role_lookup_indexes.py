@@ -0,0 +1,41 @@
+"""add user role lookup indexes
+
+Revision ID: d5a8f31e7c90
+Revises: c47a9e13b6d2
+Create Date: 2026-10-18 11:12:45.930128
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8f31e7c90'
+down_revision: Union[str, None] = 'c47a9e13b6d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_org_role_alive',
+        'users',
+        ['organization_id', 'role'],
+        unique=False,
+        postgresql_include=['status'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_users_role_status_alive',
+        'users',
+        ['role', 'status'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_status_alive', table_name='users')
+    op.drop_index('ix_users_org_role_alive', table_name='users')
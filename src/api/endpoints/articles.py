@@ -14,10 +14,11 @@ from src.schemas.article import (
     ArticleListResponse,
     ArticleSummary,
     ArticleFilterParams,
+    ArticleSortBy,
     ArticlePublish,
     CategoryListResponse
 )
-from src.schemas.shared import MessageResponse
+from src.schemas.shared import MessageResponse, cached_filter_params
 from src.auth.permissions import get_current_active_user, admin_required
 from src.utils.direct_file_upload import (
     DirectFileUploader,
@@ -82,7 +83,7 @@ async def get_articles(
     search: Optional[str] = Query(None, description="Search in title, description, or category"),
     category: Optional[str] = Query(None, description="Filter by category"),
     is_published: Optional[bool] = Query(None, description="Filter by publication status"),
-    sort_by: str = Query("created_at", description="Sort field"),
+    sort_by: ArticleSortBy = Query("created_at", description="Sort field"),
     sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
     article_service: ArticleService = Depends(get_article_service),
 ):
@@ -91,7 +92,8 @@ async def get_articles(
     
     Public endpoint - no authentication required.
     """
-    filters = ArticleFilterParams(
+    filters = cached_filter_params(
+        ArticleFilterParams,
         page=page,
         size=size,
         search=search,
@@ -206,7 +208,7 @@ async def get_article_summaries(
     search: Optional[str] = Query(None, description="Search term"),
     category: Optional[str] = Query(None, description="Filter by category"),
     is_published: Optional[bool] = Query(None, description="Filter by publication status"),
-    sort_by: str = Query("created_at", description="Sort field"),
+    sort_by: ArticleSortBy = Query("created_at", description="Sort field"),
     sort_order: str = Query("desc", regex="^(asc|desc)$", description="Sort order"),
     article_service: ArticleService = Depends(get_article_service),
 ):
@@ -215,7 +217,8 @@ async def get_article_summaries(
     
     Public endpoint - no authentication required.
     """
-    filters = ArticleFilterParams(
+    filters = cached_filter_params(
+        ArticleFilterParams,
         page=page,
         size=size,
         search=search,
@@ -11,10 +11,13 @@ from src.schemas.board_management import (
     BoardGroupCreate,
     BoardGroupUpdate,
     BoardGroupFilterParams,
+    BoardGroupSortBy,
     BoardMemberCreate,
     BoardMemberUpdate,
-    BoardMemberFilterParams
+    BoardMemberFilterParams,
+    BoardMemberSortBy
 )
+from src.schemas.shared import cached_filter_params
 from src.auth.permissions import admin_required
 from src.utils.direct_file_upload import (
     DirectFileUploader,
@@ -57,11 +60,12 @@ async def get_board_groups(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
-    sort_by: str = Query("display_order"),
+    sort_by: BoardGroupSortBy = Query("display_order"),
     sort_order: str = Query("asc", regex="^(asc|desc)$"),
     board_group_service: BoardGroupService = Depends(get_board_group_service),
 ):
-    filters = BoardGroupFilterParams(
+    filters = cached_filter_params(
+        BoardGroupFilterParams,
         page=page,
         size=size,
         search=search,
@@ -124,11 +128,12 @@ async def get_board_members(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
-    sort_by: str = Query("member_order"),
+    sort_by: BoardMemberSortBy = Query("member_order"),
     sort_order: str = Query("asc", regex="^(asc|desc)$"),
     board_member_service: BoardMemberService = Depends(get_board_member_service),
 ):
-    filters = BoardMemberFilterParams(
+    filters = cached_filter_params(
+        BoardMemberFilterParams,
         page=page,
         size=size,
         search=search,
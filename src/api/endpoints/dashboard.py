@@ -19,6 +19,7 @@ from src.schemas.dashboard import (
     PrincipalDashboard,
     AdminDashboard
 )
+from src.schemas.shared import cached_filter_params
 from src.utils.messages import get_message
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
@@ -69,7 +70,8 @@ async def get_dashboard(
     """
     
     # Create filters object
-    filters = DashboardFilters(
+    filters = cached_filter_params(
+        DashboardFilters,
         period_id=period_id,
         organization_id=organization_id,
         include_inactive=include_inactive
@@ -100,7 +102,7 @@ async def get_teacher_dashboard(
     
     **Required:** period_id - Evaluation period to filter data
     """
-    filters = DashboardFilters(period_id=period_id)
+    filters = cached_filter_params(DashboardFilters, period_id=period_id)
     result = await dashboard_service.get_dashboard_data(current_user, filters)
     
     # Check if user is actually a teacher, if not return 403 Forbidden
@@ -134,7 +136,7 @@ async def get_principal_dashboard(
     
     **Required:** period_id - Evaluation period to filter data
     """
-    filters = DashboardFilters(period_id=period_id)
+    filters = cached_filter_params(DashboardFilters, period_id=period_id)
     
     # Validate that user has principal role before allowing access
     result = await dashboard_service.get_dashboard_data(current_user, filters)
@@ -172,7 +174,8 @@ async def get_admin_dashboard(
     **Required:** period_id - Evaluation period to filter data
     **Optional:** organization_id - Filter to specific organization
     """
-    filters = DashboardFilters(
+    filters = cached_filter_params(
+        DashboardFilters,
         period_id=period_id,
         organization_id=organization_id
     )
@@ -205,7 +208,7 @@ async def get_quick_stats(
     - Recent activities
     - Role-specific metrics
     """
-    filters = DashboardFilters(period_id=period_id)
+    filters = cached_filter_params(DashboardFilters, period_id=period_id)
     dashboard_data = await dashboard_service.get_dashboard_data(current_user, filters)
     
     # Extract quick stats based on dashboard type
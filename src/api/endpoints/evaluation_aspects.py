@@ -1,7 +1,7 @@
 """Evaluation Aspect API endpoints."""
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
@@ -14,7 +14,6 @@ from src.schemas.evaluation_aspect import (
     EvaluationAspectUpdate,
     EvaluationAspectResponse,
     EvaluationAspectListResponse,
-    EvaluationAspectSummary,
     EvaluationAspectBulkCreate,
     EvaluationAspectBulkUpdate,
     EvaluationAspectBulkDelete,
@@ -23,7 +22,10 @@ from src.schemas.evaluation_aspect import (
     EvaluationAspectStats,
     AspectOrderUpdate,
     CategoryAspectsReorder,
-    CategoryWithAspectsResponse
+    CategoryWithAspectsResponse,
+    dump_aspect,
+    dump_aspect_list,
+    dump_aspect_stats
 )
 from src.schemas.evaluation_category import (
     EvaluationCategoryCreate,
@@ -31,7 +33,9 @@ from src.schemas.evaluation_category import (
     EvaluationCategoryResponse,
     EvaluationCategorySummary,
     CategoryOrderUpdate,
-    EvaluationCategoryListResponse
+    EvaluationCategoryListResponse,
+    dump_category,
+    dump_category_list
 )
 from src.schemas.evaluation_aspect import EvaluationAspectFilterParams
 from src.schemas.shared import MessageResponse
@@ -58,7 +62,8 @@ async def get_comprehensive_analytics(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Get comprehensive evaluation aspect analytics, statistics and recommendations."""
-    return await aspect_service.get_comprehensive_stats()
+    stats = await aspect_service.get_comprehensive_stats()
+    return Response(content=dump_aspect_stats(stats), media_type="application/json")
 
 
 # ===== CATEGORY MANAGEMENT =====
@@ -75,7 +80,12 @@ async def create_category(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Create a new evaluation category. Requires admin role."""
-    return await aspect_service.create_category(category_data, current_user.get("id"))
+    category = await aspect_service.create_category(category_data, current_user.get("id"))
+    return Response(
+        content=dump_category(category),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
 
 @router.put(
@@ -90,7 +100,8 @@ async def update_category(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Update an evaluation category (name, description, etc.). Requires admin role."""
-    return await aspect_service.update_category(category_id, category_data, current_user.get("id"))
+    category = await aspect_service.update_category(category_id, category_data, current_user.get("id"))
+    return Response(content=dump_category(category), media_type="application/json")
 
 
 @router.delete(
@@ -118,7 +129,8 @@ async def get_categories(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Get all categories with order information and aspect counts."""
-    return await aspect_service.get_categories_with_order()
+    categories = await aspect_service.get_categories_with_order()
+    return Response(content=dump_category_list(categories), media_type="application/json")
 
 
 @router.get(
@@ -132,7 +144,8 @@ async def get_aspects_by_category_ordered(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Get evaluation aspects by category ID with proper ordering."""
-    return await aspect_service.get_aspects_by_category_ordered(category_id)
+    aspects = await aspect_service.get_aspects_by_category_ordered(category_id)
+    return Response(content=dump_aspect_list(aspects), media_type="application/json")
 
 
 @router.get(
@@ -222,7 +235,12 @@ async def bulk_create_aspects(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Bulk create evaluation aspects. Requires admin role."""
-    return await aspect_service.bulk_create_aspects(bulk_data, current_user.get("id"))
+    aspects = await aspect_service.bulk_create_aspects(bulk_data, current_user.get("id"))
+    return Response(
+        content=dump_aspect_list(aspects),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
 
 @router.patch(
@@ -280,7 +298,12 @@ async def create_aspect(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Create a new evaluation aspect with automatic sync to existing teacher evaluations. Requires admin role."""
-    return await aspect_service.create_aspect(aspect_data, current_user.get("id"))
+    aspect = await aspect_service.create_aspect(aspect_data, current_user.get("id"))
+    return Response(
+        content=dump_aspect(aspect),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -308,7 +331,8 @@ async def get_aspect(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Get evaluation aspect by ID with statistics."""
-    return await aspect_service.get_aspect_by_id(aspect_id)
+    aspect = await aspect_service.get_aspect_by_id(aspect_id)
+    return Response(content=dump_aspect(aspect), media_type="application/json")
 
 
 @router.put(
@@ -323,7 +347,8 @@ async def update_aspect(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Update evaluation aspect with automatic sync to teacher evaluations. Requires admin role."""
-    return await aspect_service.update_aspect(aspect_id, aspect_data, current_user.get("id"))
+    aspect = await aspect_service.update_aspect(aspect_id, aspect_data, current_user.get("id"))
+    return Response(content=dump_aspect(aspect), media_type="application/json")
 
 
 @router.delete(
@@ -351,7 +376,8 @@ async def activate_aspect(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Activate evaluation aspect and automatically add to all existing teacher evaluations. Requires admin role."""
-    return await aspect_service.activate_aspect(aspect_id, current_user.get("id"))
+    aspect = await aspect_service.activate_aspect(aspect_id, current_user.get("id"))
+    return Response(content=dump_aspect(aspect), media_type="application/json")
 
 
 @router.patch(
@@ -365,4 +391,5 @@ async def deactivate_aspect(
     aspect_service: EvaluationAspectService = Depends(get_aspect_service)
 ):
     """Deactivate evaluation aspect and automatically remove from all teacher evaluations. Requires admin role."""
-    return await aspect_service.deactivate_aspect(aspect_id, current_user.get("id"))
\ No newline at end of file
+    aspect = await aspect_service.deactivate_aspect(aspect_id, current_user.get("id"))
+    return Response(content=dump_aspect(aspect), media_type="application/json")
\ No newline at end of file
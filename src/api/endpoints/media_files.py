@@ -91,15 +91,15 @@ async def list_media_files(
     elif user_role in ["kepala_sekolah", "KEPALA_SEKOLAH"]:
         # Kepala sekolah can see files from same organization and public files
         if not filters.organization_id and not filters.is_public:
-            filters.organization_id = user_organization_id
+            filters = filters.model_copy(update={"organization_id": user_organization_id})
     elif user_role in ["guru", "GURU"]:
         # Guru can only see their own files and public files
         if not filters.uploader_id and not filters.is_public:
-            filters.uploader_id = current_user["id"]
+            filters = filters.model_copy(update={"uploader_id": current_user["id"]})
     else:
         # Other users can only see their own files and public files
         if not filters.uploader_id and not filters.is_public:
-            filters.uploader_id = current_user["id"]
+            filters = filters.model_copy(update={"uploader_id": current_user["id"]})
     
     return await service.list_files(
         filters=filters,
@@ -296,8 +296,10 @@ async def get_pending_reviews(
         pass
     elif user_role == "KEPALA_SEKOLAH":
         # Kepala sekolah can only see guru submissions from their organization
-        filters.organization_id = current_user.get("organization_id")
-        filters.submitter_role = "GURU"  # Only show guru submissions for kepala sekolah to review
+        filters = filters.model_copy(update={
+            "organization_id": current_user.get("organization_id"),
+            "submitter_role": "GURU",  # Only show guru submissions for kepala sekolah to review
+        })
 
     return await rpp_service.get_submissions(filters, limit, offset)
 
@@ -368,14 +370,14 @@ async def get_submissions(
     if user_role in ["SUPER_ADMIN", "ADMIN"]:
         # Admin can filter by organization_id if provided
         if organization_id:
-            filters.organization_id = organization_id
+            filters = filters.model_copy(update={"organization_id": organization_id})
     else:
         if user_role == "KEPALA_SEKOLAH":
             # Kepala sekolah can see submissions in their organization
-            filters.organization_id = current_user.get("organization_id")
+            filters = filters.model_copy(update={"organization_id": current_user.get("organization_id")})
         elif user_role == "GURU":
             # Teachers can only see their own submissions
-            filters.teacher_id = current_user["id"]
+            filters = filters.model_copy(update={"teacher_id": current_user["id"]})
 
     return await rpp_service.get_submissions(filters, limit, offset)
 
@@ -501,8 +503,8 @@ async def get_submission_items(
     user_role = current_user.get("role")
     if user_role not in ["SUPER_ADMIN", "ADMIN"]:
         if user_role == "KEPALA_SEKOLAH":
-            filters.organization_id = current_user.get("organization_id")
+            filters = filters.model_copy(update={"organization_id": current_user.get("organization_id")})
         elif user_role == "GURU":
-            filters.teacher_id = current_user["id"]
+            filters = filters.model_copy(update={"teacher_id": current_user["id"]})
 
     return await rpp_service.get_submission_items(filters, limit, offset)
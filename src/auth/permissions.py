@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.jwt import verify_token
 from src.core.database import get_db
+from src.models.enums import UserStatus
 
 
 class JWTBearer(HTTPBearer):
@@ -69,14 +70,15 @@ async def get_current_user(
         except (ValueError, TypeError):
             raise credentials_exception
 
-        # Get user from database
+        # Get the auth columns only; full User entities are not needed here
         user_repo = UserRepository(session)
-        user = await user_repo.get_by_id(user_id)
+        user = await user_repo.get_auth_summary(user_id)
 
         if not user:
             raise credentials_exception
         
-        if not user.is_active:
+        is_active = user.status == UserStatus.ACTIVE
+        if not is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User account is deactivated"
@@ -90,7 +92,7 @@ async def get_current_user(
             "email": user.email,
             "role": user_role,              # Single role string
             "organization_id": user.organization_id,
-            "is_active": user.is_active,
+            "is_active": is_active,
             "profile": user.profile or {}
         }
 
@@ -104,6 +106,9 @@ async def get_current_user(
         raise credentials_exception
     except ValueError:
         raise credentials_exception
+    except HTTPException:
+        # Deliberate 401/403 responses from above pass through unchanged
+        raise
     except Exception as e:
         # Add logging for debugging
         import logging
@@ -134,16 +139,20 @@ def require_roles(required_roles: List[str]):
     Returns:
         Dependency function that checks user roles
     """
+    # Resolved once per dependency, not on every request
+    allowed_roles = frozenset(required_roles)
+    denied_detail = f"Access denied. Required roles: {', '.join(required_roles)}. Your role: "
+
     async def _check_roles(
         current_user: Dict = Depends(get_current_active_user),
     ) -> Dict:
         user_role = current_user.get("role")
         
         # Check if user has any of the required roles
-        if user_role not in required_roles:
+        if user_role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {', '.join(required_roles)}. Your role: {user_role}",
+                detail=f"{denied_detail}{user_role}",
             )
         
         return current_user
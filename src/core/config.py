@@ -29,8 +29,11 @@ class Settings(BaseSettings):
     SQL_ECHO: bool = False
 
     # Database connection pool settings
-    DB_POOL_SIZE: int = 10
-    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; recycle before server/proxy idle timeouts
+    DB_COMMAND_TIMEOUT: int = 30  # seconds; asyncpg per-statement timeout
 
     # JWT Settings
     JWT_SECRET_KEY: str
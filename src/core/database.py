@@ -15,7 +15,18 @@ engine = create_async_engine(
     echo=settings.SQL_ECHO,
     pool_pre_ping=True,
     pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_reset_on_return="rollback",
+    connect_args={
+        "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        "server_settings": {
+            # Short OLTP queries never benefit from JIT compilation
+            "jit": "off",
+            "application_name": settings.PROJECT_NAME,
+        },
+    },
 )
 
 # Create async session factory
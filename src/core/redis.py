@@ -193,35 +193,45 @@ async def redis_increment(key: str, amount: int = 1, expire: Optional[int] = Non
         return None
 
 
-async def redis_get_pattern(pattern: str) -> list:
-    """Get all keys matching a pattern."""
+async def redis_get_pattern(pattern: str, count: int = 1000) -> list:
+    """Get all keys matching a pattern.
+
+    Uses incremental SCAN rather than KEYS so a large keyspace never blocks
+    the Redis server for the whole sweep.
+    """
     client = await get_redis()
     if not client:
         return []
     
     try:
-        keys = await client.keys(pattern)
-        return keys
+        # SCAN may yield a key more than once; keep the first occurrence
+        keys = [key async for key in client.scan_iter(match=pattern, count=count)]
+        return list(dict.fromkeys(keys))
         
     except Exception as e:
-        logger.error(f"Redis KEYS error for pattern {pattern}: {e}")
+        logger.error(f"Redis SCAN error for pattern {pattern}: {e}")
         return []
 
 
-async def redis_flush_pattern(pattern: str) -> int:
-    """Delete all keys matching a pattern."""
+async def redis_flush_pattern(pattern: str, batch_size: int = 1000) -> int:
+    """Delete all keys matching a pattern, in bounded batches."""
     client = await get_redis()
     if not client:
         return 0
     
     try:
-        keys = await redis_get_pattern(pattern)
-        if not keys:
-            return 0
+        deleted = 0
+        batch = []
+        async for key in client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted += await client.delete(*batch)
+                batch = []
         
-        result = await client.delete(*keys)
-        return result
+        if batch:
+            deleted += await client.delete(*batch)
+        return deleted
         
     except Exception as e:
         logger.error(f"Redis FLUSH error for pattern {pattern}: {e}")
-        return 0
\ No newline at end of file
+        return 0
@@ -2,9 +2,15 @@
 
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import func
 from sqlmodel import Field, SQLModel
 
 
+# Server-side "now" for bulk UPDATEs. Timestamp columns hold naive UTC
+# (datetime.utcnow), so the transaction timestamp is converted to match.
+UTC_NOW = func.timezone("UTC", func.now())
+
+
 class TimestampMixin(SQLModel):
     """Mixin for timestamp fields."""
     created_at: datetime = Field(default_factory=datetime.utcnow)
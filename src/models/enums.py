@@ -72,24 +72,28 @@ class EvaluationGrade(str, Enum):
     @classmethod
     def get_score(cls, grade: str) -> int:
         """Get numeric score for grade."""
-        score_map = {
-            cls.A.value: 4,
-            cls.B.value: 3,
-            cls.C.value: 2,
-            cls.D.value: 1
-        }
-        return score_map.get(grade, 0)
+        return _GRADE_SCORES.get(grade, 0)
     
     @classmethod
     def get_description(cls, grade: str) -> str:
         """Get description for grade."""
-        desc_map = {
-            cls.A.value: "Excellent",
-            cls.B.value: "Good", 
-            cls.C.value: "Satisfactory",
-            cls.D.value: "Needs Improvement"
-        }
-        return desc_map.get(grade, "Unknown")
+        return _GRADE_DESCRIPTIONS.get(grade, "Unknown")
+
+
+# Built once at import instead of per call; kept outside the enum body so
+# they do not become members
+_GRADE_SCORES = {
+    EvaluationGrade.A.value: 4,
+    EvaluationGrade.B.value: 3,
+    EvaluationGrade.C.value: 2,
+    EvaluationGrade.D.value: 1
+}
+_GRADE_DESCRIPTIONS = {
+    EvaluationGrade.A.value: "Excellent",
+    EvaluationGrade.B.value: "Good",
+    EvaluationGrade.C.value: "Satisfactory",
+    EvaluationGrade.D.value: "Needs Improvement"
+}
 
 
 
@@ -4,7 +4,7 @@ from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 import uuid as uuid_lib
 from sqlmodel import Field, SQLModel, Column, JSON, Relationship
-from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import Enum as SQLEnum, Index, text
 
 from .base import BaseModel
 from .enums import UserStatus, UserRole
@@ -21,6 +21,32 @@ class User(BaseModel, SQLModel, table=True):
     """Unified User model for all system users."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # Backs the default created_at ordering and keyset cursors in user search
+        Index(
+            "ix_users_created_at_id_alive",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Role-per-organization lookups (teachers/principals by organization,
+        # per-organization teacher counts); status is included so the active
+        # filter is answered from the index.
+        Index(
+            "ix_users_org_role_alive",
+            "organization_id",
+            "role",
+            postgresql_include=["status"],
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Role-wide lookups (admins, users by role, role counts)
+        Index(
+            "ix_users_role_status_alive",
+            "role",
+            "status",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
     
     id: int = Field(primary_key=True)
     email: str = Field(max_length=255, unique=True, nullable=False, index=True)
@@ -130,9 +156,8 @@ class User(BaseModel, SQLModel, table=True):
     
     def update_profile_field(self, key: str, value: str) -> None:
         """Update specific profile field."""
-        if self.profile is None:
-            self.profile = {}
-        self.profile[key] = value
+        # Reassign instead of mutating in place so cached user snapshots stay untouched
+        self.profile = {**(self.profile or {}), key: value}
     
     def has_role(self, role_name: str) -> bool:
         """Check if user has specific role."""
@@ -155,6 +180,14 @@ class PasswordResetToken(BaseModel, SQLModel, table=True):
     """Password reset token model for unified schema."""
     
     __tablename__ = "password_reset_tokens"
+    __table_args__ = (
+        # Partial index backing cleanup_expired_tokens' expiry scan
+        Index(
+            "ix_password_reset_tokens_expires_at_unused",
+            "expires_at",
+            postgresql_where=text("used = false"),
+        ),
+    )
     
     id: str = Field(
         default_factory=lambda: str(uuid_lib.uuid4()),
@@ -2,11 +2,21 @@
 
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime
+from cachetools import TTLCache
 from sqlalchemy import select, and_, or_, func, update, delete, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.models.article import Article
-from src.schemas.article import ArticleCreate, ArticleUpdate, ArticleFilterParams
+from src.models.base import UTC_NOW
+from src.schemas.article import ArticleCreate, ArticleUpdate, ArticleFilterParams, ArticleSummary
+
+
+# Distinct article categories; cleared on writes that can add or remove one.
+_category_cache: TTLCache = TTLCache(maxsize=1, ttl=60)
+
+# Columns backing ArticleSummary, derived from the schema so they cannot drift
+_ARTICLE_SUMMARY_COLUMNS = tuple(getattr(Article, name) for name in ArticleSummary.model_fields)
 
 
 class ArticleRepository:
@@ -37,6 +47,7 @@ class ArticleRepository:
         
         self.session.add(article)
         await self.session.commit()
+        _category_cache.clear()
         await self.session.refresh(article)
         return article
     
@@ -78,6 +89,7 @@ class ArticleRepository:
         article.updated_by = updated_by
         
         await self.session.commit()
+        _category_cache.clear()
         await self.session.refresh(article)
         return article
     
@@ -87,13 +99,14 @@ class ArticleRepository:
             update(Article)
             .where(Article.id == article_id)
             .values(
-                deleted_at=datetime.utcnow(),
+                deleted_at=UTC_NOW,
                 deleted_by=deleted_by,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
         await self.session.commit()
+        _category_cache.clear()
         return result.rowcount > 0
     
     async def hard_delete(self, article_id: int) -> bool:
@@ -101,6 +114,7 @@ class ArticleRepository:
         query = delete(Article).where(Article.id == article_id)
         result = await self.session.execute(query)
         await self.session.commit()
+        _category_cache.clear()
         return result.rowcount > 0
     
     async def slug_exists(self, slug: str, exclude_article_id: Optional[int] = None) -> bool:
@@ -122,37 +136,63 @@ class ArticleRepository:
     
     async def get_all_filtered(self, filters: ArticleFilterParams) -> Tuple[List[Article], int]:
         """Get articles with filters and pagination."""
-        # Base query
-        query = select(Article).where(Article.deleted_at.is_(None))
-        count_query = select(func.count(Article.id)).where(Article.deleted_at.is_(None))
+        # Build the predicates once and share them between page and count queries
+        conditions = self._filter_conditions(filters)
+        
+        query = self._apply_sort_and_page(select(Article).where(*conditions), filters)
+        count_query = select(func.count(Article.id)).where(*conditions)
+        
+        # Execute queries
+        result = await self.session.execute(query)
+        articles = result.scalars().all()
+        
+        count_result = await self.session.execute(count_query)
+        total = count_result.scalar()
+        
+        return list(articles), total
+    
+    async def get_summaries_filtered(self, filters: ArticleFilterParams) -> List[Article]:
+        """Get a page of articles loading only the ArticleSummary columns.
+
+        Skips the article body and the total count, which summaries never use.
+        """
+        query = self._apply_sort_and_page(
+            select(Article)
+            .options(load_only(*_ARTICLE_SUMMARY_COLUMNS))
+            .where(*self._filter_conditions(filters)),
+            filters
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+    
+    def _filter_conditions(self, filters: ArticleFilterParams) -> list:
+        """Build the WHERE predicates for an article listing."""
+        conditions = [Article.deleted_at.is_(None)]
         
-        # Apply filters
         if filters.search:
-            search_filter = or_(
-                Article.title.ilike(f"%{filters.search}%"),
-                Article.description.ilike(f"%{filters.search}%"),
-                Article.category.ilike(f"%{filters.search}%")
-            )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
+            search_term = f"%{filters.search}%"
+            conditions.append(or_(
+                Article.title.ilike(search_term),
+                Article.description.ilike(search_term),
+                Article.category.ilike(search_term)
+            ))
         
         if filters.category:
-            query = query.where(Article.category == filters.category)
-            count_query = count_query.where(Article.category == filters.category)
+            conditions.append(Article.category == filters.category)
         
         if filters.is_published is not None:
-            query = query.where(Article.is_published == filters.is_published)
-            count_query = count_query.where(Article.is_published == filters.is_published)
+            conditions.append(Article.is_published == filters.is_published)
         
         if filters.published_after:
-            query = query.where(Article.published_at >= filters.published_after)
-            count_query = count_query.where(Article.published_at >= filters.published_after)
+            conditions.append(Article.published_at >= filters.published_after)
         
         if filters.published_before:
-            query = query.where(Article.published_at <= filters.published_before)
-            count_query = count_query.where(Article.published_at <= filters.published_before)
+            conditions.append(Article.published_at <= filters.published_before)
         
-        # Apply sorting
+        return conditions
+    
+    def _apply_sort_and_page(self, query, filters: ArticleFilterParams):
+        """Apply the requested ordering and pagination to an article query."""
         if filters.sort_by == "title":
             sort_column = Article.title
         elif filters.sort_by == "category":
@@ -171,16 +211,7 @@ class ArticleRepository:
         
         # Apply pagination
         offset = (filters.page - 1) * filters.size
-        query = query.offset(offset).limit(filters.size)
-        
-        # Execute queries
-        result = await self.session.execute(query)
-        articles = result.scalars().all()
-        
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar()
-        
-        return list(articles), total
+        return query.offset(offset).limit(filters.size)
     
     async def get_published_articles(self, limit: Optional[int] = None) -> List[Article]:
         """Get published articles only."""
@@ -266,15 +297,19 @@ class ArticleRepository:
     # ===== STATISTICS AND METADATA =====
     
     async def get_categories(self) -> List[str]:
-        """Get all unique categories."""
-        query = (
-            select(Article.category)
-            .where(Article.deleted_at.is_(None))
-            .distinct()
-            .order_by(Article.category)
-        )
-        result = await self.session.execute(query)
-        return [category for category in result.scalars().all() if category]
+        """Get all unique categories (cached until an article write)."""
+        categories = _category_cache.get("categories")
+        if categories is None:
+            query = (
+                select(Article.category)
+                .where(Article.deleted_at.is_(None))
+                .distinct()
+                .order_by(Article.category)
+            )
+            result = await self.session.execute(query)
+            categories = tuple(category for category in result.scalars().all() if category)
+            _category_cache["categories"] = categories
+        return list(categories)
     
     async def get_article_statistics(self) -> Dict[str, Any]:
         """Get article statistics."""
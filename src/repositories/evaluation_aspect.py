@@ -1,19 +1,53 @@
 """EvaluationAspect repository for PKG system."""
 
-from typing import List, Optional, Tuple, Dict, Any
-from datetime import datetime
-from decimal import Decimal
-from sqlalchemy import select, and_, or_, func, update, delete
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Dict, Any
+from sqlalchemy import select, and_, or_, func, update, delete, values, column, bindparam, Integer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.models.evaluation_aspect import EvaluationAspect
 from src.models.evaluation_category import EvaluationCategory
 from src.models.teacher_evaluation import TeacherEvaluation
+from src.models.base import UTC_NOW
 from src.schemas.evaluation_aspect import EvaluationAspectCreate, EvaluationAspectUpdate
 from src.schemas.evaluation_aspect import EvaluationAspectFilterParams
 
 
+@lru_cache(maxsize=32)
+def _aspect_filter_template(
+    has_search: bool,
+    has_is_active: bool,
+    has_category: bool,
+    has_created_after: bool,
+    has_created_before: bool
+) -> Tuple[Any, ...]:
+    """Build the WHERE predicates for one filter shape; values are bound at execute time."""
+    conditions = [EvaluationAspect.deleted_at.is_(None)]
+    
+    if has_search:
+        conditions.append(or_(
+            EvaluationAspect.aspect_name.ilike(bindparam("search")),
+            EvaluationAspect.description.ilike(bindparam("search"))
+        ))
+    
+    # Note: organization_id filter removed - aspects are now universal
+    
+    if has_is_active:
+        conditions.append(EvaluationAspect.is_active == bindparam("is_active"))
+    
+    if has_category:
+        conditions.append(EvaluationAspect.category_id == bindparam("category_id"))
+    
+    if has_created_after:
+        conditions.append(EvaluationAspect.created_at >= bindparam("created_after"))
+    
+    if has_created_before:
+        conditions.append(EvaluationAspect.created_at <= bindparam("created_before"))
+    
+    return tuple(conditions)
+
+
 class EvaluationAspectRepository:
     """Repository for evaluation aspect operations."""
     
@@ -85,8 +119,8 @@ class EvaluationAspectRepository:
             update(EvaluationAspect)
             .where(EvaluationAspect.id == aspect_id)
             .values(
-                deleted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                deleted_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -100,7 +134,7 @@ class EvaluationAspectRepository:
             .where(EvaluationAspect.id == aspect_id)
             .values(
                 is_active=True,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -114,7 +148,7 @@ class EvaluationAspectRepository:
             .where(EvaluationAspect.id == aspect_id)
             .values(
                 is_active=False,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -125,39 +159,30 @@ class EvaluationAspectRepository:
     
     async def get_all_aspects_filtered(self, filters: EvaluationAspectFilterParams) -> Tuple[List[EvaluationAspect], int]:
         """Get evaluation aspects with filters and pagination."""
+        conditions = _aspect_filter_template(
+            bool(filters.q),
+            filters.is_active is not None,
+            bool(filters.category_id),
+            filters.created_after_at is not None,
+            filters.created_before_at is not None
+        )
+        params = {
+            name: value
+            for name, value in (
+                ("search", f"%{filters.q}%" if filters.q else None),
+                ("is_active", filters.is_active),
+                ("category_id", filters.category_id or None),
+                ("created_after", filters.created_after_at),
+                ("created_before", filters.created_before_at)
+            )
+            if value is not None
+        }
+        
         # Base query with eager loading
         query = select(EvaluationAspect).options(
             selectinload(EvaluationAspect.category)
-        ).where(EvaluationAspect.deleted_at.is_(None))
-        count_query = select(func.count(EvaluationAspect.id)).where(EvaluationAspect.deleted_at.is_(None))
-        
-        # Apply filters
-        if filters.q:
-            search_filter = or_(
-                EvaluationAspect.aspect_name.ilike(f"%{filters.q}%"),
-                EvaluationAspect.description.ilike(f"%{filters.q}%")
-            )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
-        
-        # Note: organization_id filter removed - aspects are now universal
-        
-        if filters.is_active is not None:
-            query = query.where(EvaluationAspect.is_active == filters.is_active)
-            count_query = count_query.where(EvaluationAspect.is_active == filters.is_active)
-        
-        if filters.category_id:
-            query = query.where(EvaluationAspect.category_id == filters.category_id)
-            count_query = count_query.where(EvaluationAspect.category_id == filters.category_id)
-        
-        
-        if filters.created_after:
-            query = query.where(EvaluationAspect.created_at >= filters.created_after)
-            count_query = count_query.where(EvaluationAspect.created_at >= filters.created_after)
-        
-        if filters.created_before:
-            query = query.where(EvaluationAspect.created_at <= filters.created_before)
-            count_query = count_query.where(EvaluationAspect.created_at <= filters.created_before)
+        ).where(*conditions)
+        count_query = select(func.count(EvaluationAspect.id)).where(*conditions)
         
         # Apply sorting
         if filters.sort_by == "aspect_name":
@@ -190,10 +215,10 @@ class EvaluationAspectRepository:
         query = query.offset(offset).limit(filters.size)
         
         # Execute queries
-        result = await self.session.execute(query)
+        result = await self.session.execute(query, params)
         aspects = result.scalars().all()
         
-        count_result = await self.session.execute(count_query)
+        count_result = await self.session.execute(count_query, params)
         total = count_result.scalar()
         
         return list(aspects), total
@@ -236,7 +261,7 @@ class EvaluationAspectRepository:
     
     # ===== BULK OPERATIONS =====
     
-    async def bulk_create(self, aspects_data: List[EvaluationAspectCreate], created_by: Optional[int] = None) -> List[EvaluationAspect]:
+    async def bulk_create(self, aspects_data: Sequence[EvaluationAspectCreate], created_by: Optional[int] = None) -> List[EvaluationAspect]:
         """Bulk create evaluation aspects."""
         aspects = []
         for aspect_data in aspects_data:
@@ -267,14 +292,14 @@ class EvaluationAspectRepository:
         
         return refreshed_aspects
     
-    async def bulk_update_status(self, aspect_ids: List[int], is_active: bool) -> int:
+    async def bulk_update_status(self, aspect_ids: Sequence[int], is_active: bool) -> int:
         """Bulk update aspect status."""
         query = (
             update(EvaluationAspect)
             .where(EvaluationAspect.id.in_(aspect_ids))
             .values(
                 is_active=is_active,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -306,6 +331,22 @@ class EvaluationAspectRepository:
             "avg_score": round(float(avg_score), 2)
         }
     
+    async def get_evaluation_counts(self, aspect_ids: Sequence[int]) -> Dict[int, int]:
+        """Count evaluation items for several aspects in one grouped query."""
+        if not aspect_ids:
+            return {}
+        
+        from src.models.teacher_evaluation_item import TeacherEvaluationItem
+        
+        query = select(
+            TeacherEvaluationItem.aspect_id,
+            func.count(TeacherEvaluationItem.id)
+        ).where(
+            TeacherEvaluationItem.aspect_id.in_(aspect_ids)
+        ).group_by(TeacherEvaluationItem.aspect_id)
+        result = await self.session.execute(query)
+        return dict(result.all())
+    
     async def get_aspects_analytics(self) -> Dict[str, Any]:
         """Get comprehensive aspects analytics."""
         base_filter = EvaluationAspect.deleted_at.is_(None)
@@ -487,7 +528,7 @@ class EvaluationAspectRepository:
     async def update_category(self, category_id: int, category_data, updated_by: int) -> Optional[EvaluationCategory]:
         """Update an evaluation category."""
         # Prepare update data
-        update_data = {"updated_by": updated_by, "updated_at": datetime.utcnow()}
+        update_data = {"updated_by": updated_by, "updated_at": UTC_NOW}
         
         if category_data.name is not None:
             update_data["name"] = category_data.name
@@ -569,7 +610,7 @@ class EvaluationAspectRepository:
                     )
                     .values(
                         display_order=EvaluationCategory.display_order + 1,
-                        updated_at=datetime.utcnow()
+                        updated_at=UTC_NOW
                     )
                 )
                 await self.session.execute(shift_query)
@@ -588,7 +629,7 @@ class EvaluationAspectRepository:
                     )
                     .values(
                         display_order=EvaluationCategory.display_order - 1,
-                        updated_at=datetime.utcnow()
+                        updated_at=UTC_NOW
                     )
                 )
                 await self.session.execute(shift_query)
@@ -599,7 +640,7 @@ class EvaluationAspectRepository:
                 .where(EvaluationCategory.id == category_id)
                 .values(
                     display_order=new_order,
-                    updated_at=datetime.utcnow()
+                    updated_at=UTC_NOW
                 )
             )
             result = await self.session.execute(update_query)
@@ -641,7 +682,7 @@ class EvaluationAspectRepository:
                     )
                     .values(
                         display_order=EvaluationAspect.display_order + 1,
-                        updated_at=datetime.utcnow()
+                        updated_at=UTC_NOW
                     )
                 )
                 await self.session.execute(shift_query)
@@ -661,7 +702,7 @@ class EvaluationAspectRepository:
                     )
                     .values(
                         display_order=EvaluationAspect.display_order - 1,
-                        updated_at=datetime.utcnow()
+                        updated_at=UTC_NOW
                     )
                 )
                 await self.session.execute(shift_query)
@@ -672,7 +713,7 @@ class EvaluationAspectRepository:
                 .where(EvaluationAspect.id == aspect_id)
                 .values(
                     display_order=new_order,
-                    updated_at=datetime.utcnow()
+                    updated_at=UTC_NOW
                 )
             )
             result = await self.session.execute(update_query)
@@ -684,25 +725,33 @@ class EvaluationAspectRepository:
             await self.session.rollback()
             return False
     
-    async def reorder_aspects_in_category(self, category_id: int, aspect_order_map: Dict[int, int]) -> bool:
-        """Reorder multiple aspects within a category."""
+    async def reorder_aspects_in_category(self, category_id: int, aspect_orders: Sequence[Tuple[int, int]]) -> bool:
+        """Reorder multiple aspects within a category in a single UPDATE ... FROM (VALUES ...)."""
+        if not aspect_orders:
+            return True
+        
+        new_orders = values(
+            column("aspect_id", Integer),
+            column("new_order", Integer),
+            name="new_orders"
+        ).data(list(aspect_orders))
+        
         try:
-            for aspect_id, new_order in aspect_order_map.items():
-                query = (
-                    update(EvaluationAspect)
-                    .where(
-                        and_(
-                            EvaluationAspect.id == aspect_id,
-                            EvaluationAspect.category_id == category_id,
-                            EvaluationAspect.deleted_at.is_(None)
-                        )
-                    )
-                    .values(
-                        display_order=new_order,
-                        updated_at=datetime.utcnow()
+            query = (
+                update(EvaluationAspect)
+                .where(
+                    and_(
+                        EvaluationAspect.id == new_orders.c.aspect_id,
+                        EvaluationAspect.category_id == category_id,
+                        EvaluationAspect.deleted_at.is_(None)
                     )
                 )
-                await self.session.execute(query)
+                .values(
+                    display_order=new_orders.c.new_order,
+                    updated_at=UTC_NOW
+                )
+            )
+            await self.session.execute(query)
             
             await self.session.commit()
             return True
@@ -781,7 +830,7 @@ class EvaluationAspectRepository:
                     .where(EvaluationCategory.id == category.id)
                     .values(
                         display_order=i,
-                        updated_at=datetime.utcnow()
+                        updated_at=UTC_NOW
                     )
                 )
                 await self.session.execute(simple_update)
@@ -805,7 +854,7 @@ class EvaluationAspectRepository:
                         .where(EvaluationAspect.id == aspect.id)
                         .values(
                             display_order=i,
-                            updated_at=datetime.utcnow()
+                            updated_at=UTC_NOW
                         )
                     )
                     await self.session.execute(simple_update)
@@ -856,7 +905,7 @@ class EvaluationAspectRepository:
                         .where(EvaluationCategory.id == category.id)
                         .values(
                             display_order=i,
-                            updated_at=datetime.utcnow()
+                            updated_at=UTC_NOW
                         )
                     )
                     await self.session.execute(update_query)
@@ -887,7 +936,7 @@ class EvaluationAspectRepository:
                         .where(EvaluationAspect.id == aspect.id)
                         .values(
                             display_order=i,
-                            updated_at=datetime.utcnow()
+                            updated_at=UTC_NOW
                         )
                     )
                     await self.session.execute(update_query)
@@ -930,8 +979,8 @@ class EvaluationAspectRepository:
                     )
                 )
                 .values(
-                    deleted_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                    deleted_at=UTC_NOW,
+                    updated_at=UTC_NOW,
                 )
             )
             await self.session.execute(aspects_delete_query)
@@ -941,8 +990,8 @@ class EvaluationAspectRepository:
                 update(EvaluationCategory)
                 .where(EvaluationCategory.id == category_id)
                 .values(
-                    deleted_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                    deleted_at=UTC_NOW,
+                    updated_at=UTC_NOW,
                     name=(EvaluationCategory.name + suffix)
                 )
             )
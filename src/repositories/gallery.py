@@ -6,6 +6,7 @@ from sqlalchemy import select, and_, or_, func, update, delete, desc, asc, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.gallery import Gallery
+from src.models.base import UTC_NOW
 from src.schemas.gallery import GalleryCreate, GalleryUpdate, GalleryFilterParams
 
 
@@ -65,9 +66,9 @@ class GalleryRepository:
             update(Gallery)
             .where(Gallery.id == gallery_id)
             .values(
-                deleted_at=datetime.utcnow(),
+                deleted_at=UTC_NOW,
                 deleted_by=deleted_by,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
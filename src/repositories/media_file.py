@@ -9,6 +9,7 @@ from sqlalchemy.orm import joinedload
 from src.models.media_file import MediaFile
 from src.models.user import User
 from src.models.organization import Organization
+from src.models.base import UTC_NOW
 from src.schemas.media_file import MediaFileCreate, MediaFileUpdate
 from src.schemas.media_file import MediaFileFilterParams
 
@@ -91,8 +92,8 @@ class MediaFileRepository:
             update(MediaFile)
             .where(MediaFile.id == file_id)
             .values(
-                deleted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                deleted_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -118,57 +119,50 @@ class MediaFileRepository:
     
     async def get_all_files_filtered(self, filters: MediaFileFilterParams) -> Tuple[List[MediaFile], int]:
         """Get media files with filters and pagination."""
-        # Base query with relationships
-        query = select(MediaFile).options(
-            joinedload(MediaFile.uploader),
-            joinedload(MediaFile.organization)
-        ).where(MediaFile.deleted_at.is_(None))
-        count_query = select(func.count(MediaFile.id)).where(MediaFile.deleted_at.is_(None))
+        # Build the predicates once and share them between page and count queries
+        conditions = [MediaFile.deleted_at.is_(None)]
         
-        # Apply filters
         if filters.q:
-            search_filter = or_(
-                MediaFile.file_name.ilike(f"%{filters.q}%"),
-                func.json_extract_path_text(MediaFile.file_metadata, 'description').ilike(f"%{filters.q}%")
-            )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
+            search_term = f"%{filters.q}%"
+            conditions.append(or_(
+                MediaFile.file_name.ilike(search_term),
+                func.json_extract_path_text(MediaFile.file_metadata, 'description').ilike(search_term)
+            ))
         
         if filters.file_type:
-            query = query.where(MediaFile.file_type == filters.file_type)
-            count_query = count_query.where(MediaFile.file_type == filters.file_type)
+            conditions.append(MediaFile.file_type == filters.file_type)
         
         if filters.file_category:
             # This would need to be implemented based on file extension logic
             pass
         
         if filters.uploader_id:
-            query = query.where(MediaFile.uploader_id == filters.uploader_id)
-            count_query = count_query.where(MediaFile.uploader_id == filters.uploader_id)
+            conditions.append(MediaFile.uploader_id == filters.uploader_id)
         
         if filters.organization_id:
-            query = query.where(MediaFile.organization_id == filters.organization_id)
-            count_query = count_query.where(MediaFile.organization_id == filters.organization_id)
+            conditions.append(MediaFile.organization_id == filters.organization_id)
         
         if filters.is_public is not None:
-            query = query.where(MediaFile.is_public == filters.is_public)
-            count_query = count_query.where(MediaFile.is_public == filters.is_public)
+            conditions.append(MediaFile.is_public == filters.is_public)
         
         if filters.min_size:
-            query = query.where(MediaFile.file_size >= filters.min_size)
-            count_query = count_query.where(MediaFile.file_size >= filters.min_size)
+            conditions.append(MediaFile.file_size >= filters.min_size)
         
         if filters.max_size:
-            query = query.where(MediaFile.file_size <= filters.max_size)
-            count_query = count_query.where(MediaFile.file_size <= filters.max_size)
+            conditions.append(MediaFile.file_size <= filters.max_size)
         
         if filters.start_date:
-            query = query.where(MediaFile.created_at >= filters.start_date)
-            count_query = count_query.where(MediaFile.created_at >= filters.start_date)
+            conditions.append(MediaFile.created_at >= filters.start_date)
         
         if filters.end_date:
-            query = query.where(MediaFile.created_at <= filters.end_date)
-            count_query = count_query.where(MediaFile.created_at <= filters.end_date)
+            conditions.append(MediaFile.created_at <= filters.end_date)
+        
+        # Base query with relationships
+        query = select(MediaFile).options(
+            joinedload(MediaFile.uploader),
+            joinedload(MediaFile.organization)
+        ).where(*conditions)
+        count_query = select(func.count(MediaFile.id)).where(*conditions)
         
         # Apply sorting
         if filters.sort_by == "file_name":
@@ -339,7 +333,7 @@ class MediaFileRepository:
             .where(MediaFile.id.in_(file_ids))
             .values(
                 is_public=is_public,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -353,7 +347,7 @@ class MediaFileRepository:
             .where(MediaFile.id.in_(file_ids))
             .values(
                 organization_id=organization_id,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -366,8 +360,8 @@ class MediaFileRepository:
             update(MediaFile)
             .where(MediaFile.id.in_(file_ids))
             .values(
-                deleted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                deleted_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -6,6 +6,7 @@ from sqlalchemy import select, and_, or_, func, update, delete, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.message import Message, MessageStatus
+from src.models.base import UTC_NOW
 from src.schemas.message import MessageCreate, MessageUpdate, MessageFilterParams
 
 
@@ -68,9 +69,9 @@ class MessageRepository:
             update(Message)
             .where(Message.id == message_id)
             .values(
-                deleted_at=datetime.utcnow(),
+                deleted_at=UTC_NOW,
                 deleted_by=deleted_by,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -88,36 +89,32 @@ class MessageRepository:
     
     async def get_all_filtered(self, filters: MessageFilterParams) -> Tuple[List[Message], int]:
         """Get messages with filters and pagination."""
-        # Base query
-        query = select(Message).where(Message.deleted_at.is_(None))
-        count_query = select(func.count(Message.id)).where(Message.deleted_at.is_(None))
+        # Build the predicates once and share them between page and count queries
+        conditions = [Message.deleted_at.is_(None)]
         
-        # Apply filters
         if filters.search:
-            search_filter = or_(
-                Message.name.ilike(f"%{filters.search}%"),
-                Message.email.ilike(f"%{filters.search}%"),
-                Message.title.ilike(f"%{filters.search}%"),
-                Message.message.ilike(f"%{filters.search}%")
-            )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
+            search_term = f"%{filters.search}%"
+            conditions.append(or_(
+                Message.name.ilike(search_term),
+                Message.email.ilike(search_term),
+                Message.title.ilike(search_term),
+                Message.message.ilike(search_term)
+            ))
         
         if filters.status:
-            query = query.where(Message.status == filters.status)
-            count_query = count_query.where(Message.status == filters.status)
+            conditions.append(Message.status == filters.status)
         
         if filters.unread_only:
-            query = query.where(Message.status == MessageStatus.UNREAD)
-            count_query = count_query.where(Message.status == MessageStatus.UNREAD)
+            conditions.append(Message.status == MessageStatus.UNREAD)
         
         if filters.created_after:
-            query = query.where(Message.created_at >= filters.created_after)
-            count_query = count_query.where(Message.created_at >= filters.created_after)
+            conditions.append(Message.created_at >= filters.created_after)
         
         if filters.created_before:
-            query = query.where(Message.created_at <= filters.created_before)
-            count_query = count_query.where(Message.created_at <= filters.created_before)
+            conditions.append(Message.created_at <= filters.created_before)
+        
+        query = select(Message).where(*conditions)
+        count_query = select(func.count(Message.id)).where(*conditions)
         
         # Apply sorting
         if filters.sort_by == "name":
@@ -179,13 +176,13 @@ class MessageRepository:
         """Bulk update message status."""
         update_values = {
             "status": status,
-            "updated_at": datetime.utcnow(),
+            "updated_at": UTC_NOW,
             "updated_by": updated_by
         }
         
         # Add timestamp based on status
         if status == MessageStatus.READ:
-            update_values["read_at"] = datetime.utcnow()
+            update_values["read_at"] = UTC_NOW
         
         query = (
             update(Message)
@@ -203,9 +200,9 @@ class MessageRepository:
             update(Message)
             .where(Message.id.in_(message_ids))
             .values(
-                deleted_at=datetime.utcnow(),
+                deleted_at=UTC_NOW,
                 deleted_by=deleted_by,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
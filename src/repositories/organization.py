@@ -8,6 +8,7 @@ from sqlalchemy.orm import selectinload
 
 from src.models.organization import Organization
 from src.models.user import User
+from src.models.base import UTC_NOW
 # Remove OrganizationType import as it's no longer used
 from src.schemas.organization import OrganizationCreate, OrganizationUpdate, OrganizationFilterParams
 
@@ -90,8 +91,8 @@ class OrganizationRepository:
             update(Organization)
             .where(Organization.id == org_id)
             .values(
-                deleted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                deleted_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -275,8 +276,8 @@ class OrganizationRepository:
             update(Organization)
             .where(Organization.id.in_(org_ids))
             .values(
-                deleted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                deleted_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(query)
@@ -12,6 +12,7 @@ from src.models.user import User
 from src.models.period import Period
 from src.models.media_file import MediaFile
 from src.models.enums import RPPSubmissionStatus
+from src.models.base import UTC_NOW
 from src.schemas.rpp_submission import (
     RPPSubmissionCreate, RPPSubmissionUpdate, RPPSubmissionFilter,
     RPPSubmissionItemCreate, RPPSubmissionItemUpdate, RPPSubmissionItemFilter
@@ -85,7 +86,7 @@ class RPPSubmissionRepository:
             .values(
                 status=submission_data.status,
                 review_notes=submission_data.review_notes,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
             .returning(RPPSubmission)
         )
@@ -107,8 +108,8 @@ class RPPSubmissionRepository:
             )
             .values(
                 status=RPPSubmissionStatus.PENDING,
-                submitted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                submitted_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         
@@ -133,8 +134,8 @@ class RPPSubmissionRepository:
                 status=status,
                 reviewer_id=reviewer_id,
                 review_notes=notes,
-                reviewed_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                reviewed_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         
@@ -149,7 +150,7 @@ class RPPSubmissionRepository:
             .where(
                 and_(RPPSubmission.id == submission_id, RPPSubmission.deleted_at.is_(None))
             )
-            .values(deleted_at=datetime.utcnow())
+            .values(deleted_at=UTC_NOW)
         )
         
         result = await self.session.execute(query)
@@ -207,8 +208,8 @@ class RPPSubmissionRepository:
             )
             .values(
                 file_id=file_id,
-                uploaded_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                uploaded_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
             .returning(RPPSubmissionItem)
         )
@@ -229,7 +230,7 @@ class RPPSubmissionRepository:
             .values(
                 name=name,
                 description=description,
-                updated_at=datetime.utcnow()
+                updated_at=UTC_NOW
             )
             .returning(RPPSubmissionItem)
         )
@@ -245,7 +246,7 @@ class RPPSubmissionRepository:
             .where(
                 and_(RPPSubmissionItem.id == item_id, RPPSubmissionItem.deleted_at.is_(None))
             )
-            .values(deleted_at=datetime.utcnow())
+            .values(deleted_at=UTC_NOW)
             .returning(RPPSubmissionItem.id)
         )
         
@@ -3,9 +3,9 @@
 from typing import List, Tuple, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, delete, update, and_
-from datetime import datetime
 
 from src.models.statistic import Statistic
+from src.models.base import UTC_NOW
 from src.schemas.statistic import StatisticFilterParams
 
 
@@ -55,7 +55,7 @@ class StatisticRepository:
                 await self._shift_display_orders(new_display_order, shift_up=True, exclude_id=statistic_id)
         
         # Update the record
-        update_data['updated_at'] = datetime.utcnow()
+        update_data['updated_at'] = UTC_NOW
         stmt = (
             update(Statistic)
             .where(and_(Statistic.id == statistic_id, Statistic.deleted_at.is_(None)))
@@ -78,8 +78,8 @@ class StatisticRepository:
             update(Statistic)
             .where(Statistic.id == statistic_id)
             .values(
-                deleted_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                deleted_at=UTC_NOW,
+                updated_at=UTC_NOW
             )
         )
         result = await self.session.execute(stmt)
@@ -191,7 +191,7 @@ class StatisticRepository:
                 .where(and_(*conditions))
                 .values(
                     display_order=Statistic.display_order + 1,
-                    updated_at=datetime.utcnow()
+                    updated_at=UTC_NOW
                 )
             )
         else:
@@ -200,7 +200,7 @@ class StatisticRepository:
                 .where(and_(*conditions))
                 .values(
                     display_order=Statistic.display_order - 1,
-                    updated_at=datetime.utcnow()
+                    updated_at=UTC_NOW
                 )
             )
         
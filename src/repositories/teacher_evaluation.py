@@ -13,6 +13,7 @@ from src.models.period import Period
 from src.models.user import User
 from src.models.organization import Organization
 from src.models.enums import EvaluationGrade, UserRole as UserRoleEnum
+from src.models.base import UTC_NOW
 from src.schemas.teacher_evaluation import (
     TeacherEvaluationCreate, TeacherEvaluationUpdate, TeacherEvaluationFilterParams,
     TeacherEvaluationItemCreate, TeacherEvaluationItemUpdate
@@ -594,8 +595,8 @@ class TeacherEvaluationRepository:
                     )
                 )
             ),
-            last_updated=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            last_updated=UTC_NOW,
+            updated_at=UTC_NOW
         )
         
         await self.session.execute(update_query)
@@ -1,16 +1,176 @@
 """User repository for unified schema system."""
 
-from typing import List, Optional, Tuple, Dict, Any, Union
-from datetime import datetime
-from sqlalchemy import select, and_, or_, func, update, delete, text
+from typing import List, Optional, Tuple, Dict, Any, Union, Callable, Awaitable
+import base64
+import binascii
+import copy
+import json
+import uuid
+from datetime import datetime, time, timedelta
+from cachetools import TTLCache
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select, and_, or_, func, update, delete, text, tuple_, bindparam, cast, literal, literal_column, exists, JSON
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, load_only, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.models.user import User, PasswordResetToken
 from src.models.enums import UserStatus, UserRole as UserRoleEnum
+from src.models.base import UTC_NOW
 from src.schemas.user import UserCreate, UserUpdate, AdminUserUpdate
 from src.schemas.user import UserFilterParams
 from src.auth.jwt import get_password_hash
 
+# Short-lived cache of user rows keyed by ("id", user_id) / ("email", email).
+# Cached instances are kept detached and merged into the caller's session.
+_user_cache: TTLCache = TTLCache(maxsize=2048, ttl=10)
+
+# Aggregate user statistics for dashboards; cleared on writes that change
+# membership, role or status.
+_user_statistics_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+
+# Columns needed to render user listings (UserResponse); skips password,
+# remember_token and the audit/soft-delete bookkeeping columns.
+_USER_LISTING_COLUMNS = (
+    User.id,
+    User.email,
+    User.profile,
+    User.img_url,
+    User.organization_id,
+    User.role,
+    User.status,
+    User.last_login_at,
+    User.created_at,
+    User.updated_at,
+)
+
+# Columns update() may assign from request data; identity, timestamps and the
+# password hash are managed by dedicated methods.
+_USER_WRITABLE_FIELDS = frozenset(column.key for column in User.__table__.columns) - {
+    "id",
+    "password",
+    "created_at",
+    "deleted_at",
+}
+
+# profile->name as text; shared so search and sort use the same expression.
+# The key is inlined, not bound, so the SQL matches ix_users_profile_name_trgm
+# and the planner can use the index with prepared statements.
+_USER_NAME = func.json_extract_path_text(User.profile, literal_column("'name'"))
+
+# Hot statements built once at import; callers only supply bind values
+_SELECT_USER_BY_ID = (
+    select(User)
+    .options(selectinload(User.organization))
+    .where(and_(User.id == bindparam("user_id"), User.deleted_at.is_(None)))
+)
+
+_SELECT_USER_BY_EMAIL = (
+    select(User)
+    .options(selectinload(User.organization))
+    .where(and_(User.email == bindparam("email"), User.deleted_at.is_(None)))
+)
+
+# Columns the auth dependency needs per request; plain rows, no entity hydration
+_SELECT_AUTH_USER_BY_ID = select(
+    User.id,
+    User.email,
+    User.role,
+    User.status,
+    User.organization_id,
+    User.profile,
+).where(and_(User.id == bindparam("user_id"), User.deleted_at.is_(None)))
+
+_COUNT_ACTIVE_USERS_WITH_ROLE = select(func.count(User.id)).where(
+    and_(
+        User.role == bindparam("role"),
+        User.deleted_at.is_(None),
+        User.status == UserStatus.ACTIVE,
+    )
+)
+
+_COUNT_USERS_WITH_ROLE = select(func.count(User.id)).where(
+    and_(User.role == bindparam("role"), User.deleted_at.is_(None))
+)
+
+_COUNT_ACTIVE_TEACHERS_BY_ORGANIZATION = select(func.count(User.id)).where(
+    and_(
+        User.organization_id == bindparam("organization_id"),
+        User.role == UserRoleEnum.GURU,
+        User.deleted_at.is_(None),
+        User.status == UserStatus.ACTIVE,
+    )
+)
+
+# Sort fields that are non-null and therefore safe for keyset pagination
+_KEYSET_SORT_COLUMNS = {
+    "created_at": User.created_at,
+    "email": User.email,
+    "id": User.id,
+}
+
+
+def encode_user_cursor(user: User, sort_by: str) -> Optional[str]:
+    """Build an opaque keyset cursor pointing just past ``user``."""
+    if sort_by not in _KEYSET_SORT_COLUMNS:
+        return None
+    value = getattr(user, sort_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([value, user.id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_user_cursor(cursor: str, sort_by: str) -> Tuple[Any, int]:
+    """Decode a cursor made by encode_user_cursor; raises ValueError if invalid."""
+    if sort_by not in _KEYSET_SORT_COLUMNS:
+        raise ValueError(f"Cursor pagination is not supported when sorting by '{sort_by}'")
+    try:
+        value, user_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if sort_by == "created_at":
+            value = datetime.fromisoformat(value)
+        return value, int(user_id)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _detached_copy(instance: Any) -> Any:
+    """Copy the loaded column values of a row into a new detached instance.
+
+    The copy shares no state with the session that loaded the original, so
+    it is safe to keep in a process-wide cache.
+    """
+    mapper = sa_inspect(instance).mapper
+    loaded = instance.__dict__
+    snapshot = mapper.class_manager.new_instance()
+    for attr in mapper.column_attrs:
+        if attr.key in loaded:
+            set_committed_value(snapshot, attr.key, copy.deepcopy(loaded[attr.key]))
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def _snapshot_user(user: User) -> User:
+    """Detached copy of a user plus its eagerly loaded organization."""
+    snapshot = _detached_copy(user)
+    if "organization" in user.__dict__:
+        organization = user.__dict__["organization"]
+        set_committed_value(
+            snapshot,
+            "organization",
+            _detached_copy(organization) if organization is not None else None,
+        )
+    return snapshot
+
+
+def _invalidate_cached_user(user_id: int) -> None:
+    """Drop every cached entry that points at the given user."""
+    for key, cached_user in list(_user_cache.items()):
+        if cached_user.id == user_id:
+            _user_cache.pop(key, None)
+
 
 class UserRepository:
     """User repository for unified schema system."""
@@ -22,74 +182,160 @@ class UserRepository:
 
     async def create(
         self, user_data: UserCreate, organization_id: Optional[int] = None
-    ) -> User:
-        """Create user with unified schema."""
+    ) -> Optional[User]:
+        """Create user with unified schema.
+
+        Returns None when the email is already taken; the unique index on
+        email decides atomically, so there is no check-then-insert race.
+        """
         # Default password if not provided
         password = user_data.password if user_data.password else "@Kemendag123"
         hashed_password = get_password_hash(password)
 
-        # Create user instance
-        user = User(
-            email=user_data.email,
-            password=hashed_password,
-            profile=user_data.profile,
-            organization_id=organization_id or user_data.organization_id,
-            role=getattr(user_data, "role", UserRoleEnum.GURU),
-            status=user_data.status,
-            last_login_at=None,
-            remember_token=None,
+        query = (
+            pg_insert(User)
+            .values(
+                email=user_data.email,
+                password=hashed_password,
+                profile=user_data.profile,
+                organization_id=organization_id or user_data.organization_id,
+                role=getattr(user_data, "role", UserRoleEnum.GURU),
+                status=user_data.status,
+                last_login_at=None,
+                remember_token=None,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
         )
+        result = await self.session.execute(query)
+        user = result.scalar_one_or_none()
+        if not user:
+            return None
 
-        self.session.add(user)
         await self.session.commit()
-        await self.session.refresh(user)
+        _user_statistics_cache.clear()
         return user
 
     async def get_by_id(self, user_id: int) -> Optional[User]:
-        """Get user by ID."""
-        from sqlalchemy.orm import selectinload
-        from src.models.organization import Organization
+        """Get user by ID (served from the short-lived user cache when possible)."""
+        return await self._get_cached(("id", user_id), lambda: self._fetch_by_id(user_id))
 
-        query = (
-            select(User)
-            .options(selectinload(User.organization))
-            .where(and_(User.id == user_id, User.deleted_at.is_(None)))
-        )
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email (served from the short-lived user cache when possible)."""
+        email = email.lower()
+        return await self._get_cached(("email", email), lambda: self._fetch_by_email(email))
+
+    async def get_auth_summary(self, user_id: int) -> Optional[Row]:
+        """Get the columns needed to authenticate a request as a plain row.
+
+        Rows are immutable, so they are cached as-is alongside the user
+        snapshots and dropped by the same invalidation.
+        """
+        key = ("auth", user_id)
+        summary = _user_cache.get(key)
+        if summary is None:
+            result = await self.session.execute(
+                _SELECT_AUTH_USER_BY_ID, {"user_id": user_id}
+            )
+            summary = result.first()
+            if summary is None:
+                return None
+            _user_cache[key] = summary
+        return summary
+
+    async def email_exists(
+        self, email: str, exclude_user_id: Optional[int] = None
+    ) -> bool:
+        """Check whether a live user already uses this email."""
+        conditions = [User.email == email.lower(), User.deleted_at.is_(None)]
+        if exclude_user_id is not None:
+            conditions.append(User.id != exclude_user_id)
+
+        query = select(exists().where(and_(*conditions)))
         result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        return bool(result.scalar())
 
-    async def get_by_email(self, email: str) -> Optional[User]:
-        """Get user by email."""
-        from sqlalchemy.orm import selectinload
+    async def _fetch_by_id(self, user_id: int) -> Optional[User]:
+        """Load user by ID from the database, bypassing the cache."""
+        result = await self.session.execute(_SELECT_USER_BY_ID, {"user_id": user_id})
+        return result.scalar_one_or_none()
 
-        query = (
-            select(User)
-            .options(selectinload(User.organization))
-            .where(and_(User.email == email.lower(), User.deleted_at.is_(None)))
-        )
-        result = await self.session.execute(query)
+    async def _fetch_by_email(self, email: str) -> Optional[User]:
+        """Load user by email from the database, bypassing the cache."""
+        result = await self.session.execute(_SELECT_USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
+    async def _get_cached(
+        self, key: Tuple[str, Any], loader: Callable[[], Awaitable[Optional[User]]]
+    ) -> Optional[User]:
+        """Return a session-bound copy of a cached user, loading it on a miss."""
+        cached_user = _user_cache.get(key)
+        if cached_user is None:
+            user = await loader()
+            if user is None:
+                return None
+            # Cache a detached copy; the loaded instance stays with the session,
+            # which may already have handed it out to the caller
+            _user_cache[key] = _snapshot_user(user)
+            return user
+
+        return await self.session.merge(cached_user, load=False)
+
     async def update(
         self, user_id: int, user_data: Union[UserUpdate, AdminUserUpdate]
     ) -> Optional[User]:
         """Update user information."""
-        user = await self.get_by_id(user_id)
+        # Update fields based on schema type
+        update_data = {
+            field: value
+            for field, value in user_data.model_dump(exclude_unset=True).items()
+            if field in _USER_WRITABLE_FIELDS and value is not None
+        }
+        return await self._update_returning(user_id, update_data)
+
+    async def _update_returning(
+        self, user_id: int, values: Dict[str, Any]
+    ) -> Optional[User]:
+        """Apply column values with a single UPDATE ... RETURNING."""
+        query = (
+            update(User)
+            .where(and_(User.id == user_id, User.deleted_at.is_(None)))
+            .values(**values, updated_at=UTC_NOW)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        user = result.scalar_one_or_none()
         if not user:
             return None
 
-        # Update fields based on schema type
-        update_data = user_data.model_dump(exclude_unset=True)
+        await self.session.commit()
+        _invalidate_cached_user(user_id)
+        _user_statistics_cache.clear()
 
-        for field, value in update_data.items():
-            if hasattr(user, field) and value is not None:
-                setattr(user, field, value)
+        # Responses read the organization name; (re)load it only when needed
+        if "organization_id" in values or "organization" not in user.__dict__:
+            await self.session.refresh(user, attribute_names=["organization"])
+        return user
 
-        user.updated_at = datetime.utcnow()
+    async def update_profile_field(self, user_id: int, key: str, value: Any) -> bool:
+        """Set a single profile key, merging it into the stored JSON server-side."""
+        merged_profile = func.coalesce(
+            cast(User.profile, JSONB), literal({}, JSONB)
+        ).op("||", return_type=JSONB)(literal({key: value}, JSONB))
 
+        query = (
+            update(User)
+            .where(and_(User.id == user_id, User.deleted_at.is_(None)))
+            .values(profile=cast(merged_profile, JSON), updated_at=UTC_NOW)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        updated = result.scalar_one_or_none() is not None
         await self.session.commit()
-        await self.session.refresh(user)
-        return user
+        _invalidate_cached_user(user_id)
+        return updated
 
     async def change_password(self, user_id: int, new_password: str) -> bool:
         """Change user password."""
@@ -97,194 +343,246 @@ class UserRepository:
         query = (
             update(User)
             .where(User.id == user_id)
-            .values(password=hashed_password, updated_at=datetime.utcnow())
+            .values(password=hashed_password, updated_at=UTC_NOW)
+            .returning(User)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(query)
+        updated = result.scalar_one_or_none() is not None
         await self.session.commit()
-        return result.rowcount > 0
+        _invalidate_cached_user(user_id)
+        return updated
 
     async def update_password(self, user_id: int, hashed_password: str) -> bool:
         """Update user password with already hashed password."""
         query = (
             update(User)
             .where(User.id == user_id)
-            .values(password=hashed_password, updated_at=datetime.utcnow())
+            .values(password=hashed_password, updated_at=UTC_NOW)
+            .returning(User)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(query)
+        updated = result.scalar_one_or_none() is not None
         await self.session.commit()
-        return result.rowcount > 0
+        _invalidate_cached_user(user_id)
+        return updated
 
     async def soft_delete(self, user_id: int) -> bool:
         """Soft delete user."""
-        import uuid
-
         suffix = f"__deleted__{uuid.uuid4().hex[:8]}"
 
         query = (
             update(User)
             .where(User.id == user_id)
             .values(
-                deleted_at=datetime.utcnow(),
+                deleted_at=UTC_NOW,
                 email=(User.email + suffix),  
             )
+            .returning(User)
+            .execution_options(populate_existing=True)
         )
         
         result = await self.session.execute(query)
+        deleted = result.scalar_one_or_none() is not None
         await self.session.commit()
-        return result.rowcount > 0
+        _invalidate_cached_user(user_id)
+        _user_statistics_cache.clear()
+        return deleted
 
     async def update_last_login(self, user_id: int) -> None:
-        """Update user last login time."""
+        """Update user last login time.
+
+        RETURNING repopulates the caller's instance: the server-side stamp
+        cannot be evaluated in Python, so the ORM would otherwise expire it
+        and the next read would lazy-load outside the async context.
+        """
         query = (
             update(User)
             .where(User.id == user_id)
-            .values(last_login_at=datetime.utcnow())
+            .values(last_login_at=UTC_NOW)
+            .returning(User)
+            .execution_options(populate_existing=True)
         )
-        await self.session.execute(query)
+        result = await self.session.execute(query)
+        result.scalar_one_or_none()
         await self.session.commit()
+        _invalidate_cached_user(user_id)
 
     # ===== USER SEARCH AND FILTERING =====
 
-    async def search(self, filters: UserFilterParams) -> Tuple[List[User], int]:
-        """Search users with filters and pagination."""
-        from sqlalchemy.orm import selectinload
-        from src.models.organization import Organization
+    async def search(
+        self, filters: UserFilterParams
+    ) -> Tuple[List[User], Optional[int]]:
+        """Search users with filters and pagination.
 
-        # Base query with relationships
-        query = (
-            select(User)
-            .options(selectinload(User.organization))
-            .where(User.deleted_at.is_(None))
-        )
-
-        # Count query for pagination
-        count_query = select(func.count(User.id)).where(User.deleted_at.is_(None))
+        Returns ``None`` as the total when paging by cursor.
+        """
+        # Build the WHERE clause once and share it between page and count
+        conditions = [User.deleted_at.is_(None)]
 
         # Apply search filter
         if filters.search:
-            search_term = f"%{filters.search}%"
-            search_filter = or_(
-                User.email.ilike(search_term),
-                func.json_extract_path_text(User.profile, "name").ilike(search_term),
+            # autoescape keeps user-typed % and _ literal instead of wildcards
+            conditions.append(
+                or_(
+                    User.email.icontains(filters.search, autoescape=True),
+                    _USER_NAME.icontains(filters.search, autoescape=True),
+                )
             )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
 
         # Apply status filter
         if filters.status:
-            query = query.where(User.status == filters.status)
-            count_query = count_query.where(User.status == filters.status)
+            conditions.append(User.status == UserStatus(filters.status))
 
         if filters.organization_id:
-            query = query.where(User.organization_id == filters.organization_id)
-            count_query = count_query.where(
-                User.organization_id == filters.organization_id
-            )
+            conditions.append(User.organization_id == filters.organization_id)
 
         if filters.role:
             # Filter by role directly from user table
-            query = query.where(User.role == filters.role)
-            count_query = count_query.where(User.role == filters.role)
+            conditions.append(User.role == UserRoleEnum(filters.role))
 
         if filters.is_active is not None:
             if filters.is_active:
-                query = query.where(User.status == UserStatus.ACTIVE)
-                count_query = count_query.where(User.status == UserStatus.ACTIVE)
+                conditions.append(User.status == UserStatus.ACTIVE)
             else:
-                query = query.where(User.status != UserStatus.ACTIVE)
-                count_query = count_query.where(User.status != UserStatus.ACTIVE)
+                conditions.append(User.status != UserStatus.ACTIVE)
 
+        # Compare the raw column against day boundaries so the predicate stays
+        # sargable; wrapping created_at in date() would bypass its index.
         if filters.created_after:
-            query = query.where(func.date(User.created_at) >= filters.created_after)
-            count_query = count_query.where(
-                func.date(User.created_at) >= filters.created_after
+            conditions.append(
+                User.created_at >= datetime.combine(filters.created_after, time.min)
             )
 
         if filters.created_before:
-            query = query.where(func.date(User.created_at) <= filters.created_before)
-            count_query = count_query.where(
-                func.date(User.created_at) <= filters.created_before
+            conditions.append(
+                User.created_at
+                < datetime.combine(filters.created_before + timedelta(days=1), time.min)
+            )
+
+        # Base query with relationships
+        query = (
+            select(User)
+            .options(
+                load_only(*_USER_LISTING_COLUMNS),
+                selectinload(User.organization),
             )
+            .where(*conditions)
+        )
 
-        # Apply sorting
+        # Count query, only needed when the requested page is empty
+        count_query = select(func.count(User.id)).where(*conditions)
+
+        # Apply sorting (id breaks ties so pages and cursors are stable)
         if filters.sort_by == "name":
-            sort_column = func.json_extract_path_text(User.profile, "name")
+            sort_column = _USER_NAME
         elif filters.sort_by == "email":
             sort_column = User.email
         else:
             sort_column = getattr(User, filters.sort_by, User.created_at)
 
-        if filters.sort_order == "desc":
-            sort_column = sort_column.desc()
+        descending = filters.sort_order == "desc"
+        if descending:
+            query = query.order_by(sort_column.desc(), User.id.desc())
+        else:
+            query = query.order_by(sort_column, User.id)
+
+        # Keyset pagination: seek past the cursor and skip the COUNT(*)
+        if filters.cursor:
+            last_value, last_id = decode_user_cursor(filters.cursor, filters.sort_by)
+            row_key = tuple_(_KEYSET_SORT_COLUMNS[filters.sort_by], User.id)
+            if descending:
+                query = query.where(row_key < tuple_(last_value, last_id))
+            else:
+                query = query.where(row_key > tuple_(last_value, last_id))
 
-        query = query.order_by(sort_column)
+            users_result = await self.session.execute(query.limit(filters.size))
+            return list(users_result.scalars().all()), None
 
-        # Apply pagination
+        # Apply pagination; COUNT(*) OVER () returns the total with the page
         offset = (filters.page - 1) * filters.size
-        query = query.offset(offset).limit(filters.size)
+        query = (
+            query.add_columns(func.count().over().label("total"))
+            .offset(offset)
+            .limit(filters.size)
+        )
 
-        # Execute queries
-        users_result = await self.session.execute(query)
-        count_result = await self.session.execute(count_query)
+        rows = (await self.session.execute(query)).all()
+        users = [row[0] for row in rows]
 
-        users = users_result.scalars().all()
-        total = count_result.scalar()
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Page past the end carries no window total; count separately
+            count_result = await self.session.execute(count_query)
+            total = count_result.scalar()
+        else:
+            total = 0
 
-        return list(users), total
+        return users, total
 
     async def get_users_by_role(self, role_name: str) -> List[User]:
         """Get users by role name."""
-        query = select(User).where(
-            and_(User.role == UserRoleEnum(role_name), User.deleted_at.is_(None))
+        query = (
+            select(User)
+            .options(
+                load_only(*_USER_LISTING_COLUMNS),
+                selectinload(User.organization),
+            )
+            .where(
+                and_(User.role == UserRoleEnum(role_name), User.deleted_at.is_(None))
+            )
         )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def count_users_with_role(self, role_name: str) -> int:
         """Count users with specific role."""
-        query = select(func.count(User.id)).where(
-            and_(
-                User.role == UserRoleEnum(role_name),
-                User.deleted_at.is_(None),
-                User.status == UserStatus.ACTIVE,
-            )
+        result = await self.session.execute(
+            _COUNT_ACTIVE_USERS_WITH_ROLE, {"role": UserRoleEnum(role_name)}
         )
-        result = await self.session.execute(query)
         return result.scalar() or 0
 
     async def count_users_with_role_enum(self, role: UserRoleEnum) -> int:
         """Count users with specific role (using enum)."""
-        query = select(func.count(User.id)).where(
-            and_(User.role == role, User.deleted_at.is_(None))
-        )
-        result = await self.session.execute(query)
+        result = await self.session.execute(_COUNT_USERS_WITH_ROLE, {"role": role})
         return result.scalar() or 0
 
     async def get_user_statistics(self) -> Dict[str, Any]:
-        """Get user statistics."""
-        # Total users
-        total_query = select(func.count(User.id)).where(User.deleted_at.is_(None))
-        total_result = await self.session.execute(total_query)
-        total_users = total_result.scalar()
-
-        # Active users
-        active_query = select(func.count(User.id)).where(
-            and_(User.deleted_at.is_(None), User.status == UserStatus.ACTIVE)
+        """Get user statistics (cached for a short period)."""
+        cached_stats = _user_statistics_cache.get("stats")
+        if cached_stats is not None:
+            return {**cached_stats, "role_distribution": dict(cached_stats["role_distribution"])}
+
+        # One grouped pass yields per-role totals and active counts
+        query = (
+            select(
+                User.role,
+                func.count(User.id),
+                func.count(User.id).filter(User.status == UserStatus.ACTIVE),
+            )
+            .where(User.deleted_at.is_(None))
+            .group_by(User.role)
         )
-        active_result = await self.session.execute(active_query)
-        active_users = active_result.scalar()
+        result = await self.session.execute(query)
 
-        # Users by role
-        role_stats = {}
-        for role in UserRoleEnum:
-            count = await self.count_users_with_role(role.value)
-            role_stats[role.value] = count
+        total_users = 0
+        active_users = 0
+        role_stats = {role.value: 0 for role in UserRoleEnum}
+        for role, role_total, role_active in result.all():
+            total_users += role_total
+            active_users += role_active
+            # Role distribution counts active users only
+            role_stats[role.value] = role_active
 
-        return {
+        stats = {
             "total_users": total_users,
             "active_users": active_users,
             "role_distribution": role_stats,
         }
+        _user_statistics_cache["stats"] = stats
+        return {**stats, "role_distribution": dict(role_stats)}
 
     # ===== ROLE MANAGEMENT =====
 
@@ -292,23 +590,18 @@ class UserRepository:
         self, user_id: int, role: UserRoleEnum
     ) -> Optional[User]:
         """Update user role."""
-        user = await self.get_by_id(user_id)
-        if not user:
-            return None
-
-        user.role = role
-        user.updated_at = datetime.utcnow()
-
-        await self.session.commit()
-        await self.session.refresh(user)
-        return user
+        return await self._update_returning(user_id, {"role": role})
 
     # ===== ORGANIZATION-RELATED METHODS =====
 
     async def get_users_by_organization(self, organization_id: int) -> List[User]:
         """Get all users belonging to a specific organization."""
-        query = select(User).where(
-            and_(User.organization_id == organization_id, User.deleted_at.is_(None))
+        query = (
+            select(User)
+            .options(load_only(*_USER_LISTING_COLUMNS))
+            .where(
+                and_(User.organization_id == organization_id, User.deleted_at.is_(None))
+            )
         )
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -329,19 +622,30 @@ class UserRepository:
 
     async def get_all_admins(self) -> List[User]:
         """Get all admin users."""
-        query = select(User).where(
-            and_(User.role == UserRoleEnum.ADMIN, User.deleted_at.is_(None))
+        query = (
+            select(User)
+            .options(
+                load_only(*_USER_LISTING_COLUMNS),
+                selectinload(User.organization),
+            )
+            .where(
+                and_(User.role == UserRoleEnum.ADMIN, User.deleted_at.is_(None))
+            )
         )
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def get_teachers_by_organization(self, organization_id: int) -> List[User]:
         """Get all teachers (guru) in specific organization."""
-        query = select(User).where(
-            and_(
-                User.organization_id == organization_id,
-                User.role == UserRoleEnum.GURU,
-                User.deleted_at.is_(None),
+        query = (
+            select(User)
+            .options(load_only(*_USER_LISTING_COLUMNS))
+            .where(
+                and_(
+                    User.organization_id == organization_id,
+                    User.role == UserRoleEnum.GURU,
+                    User.deleted_at.is_(None),
+                )
             )
         )
         result = await self.session.execute(query)
@@ -349,11 +653,15 @@ class UserRepository:
 
     async def get_principals_by_organization(self, organization_id: int) -> List[User]:
         """Get all principals (kepala_sekolah) in specific organization."""
-        query = select(User).where(
-            and_(
-                User.organization_id == organization_id,
-                User.role == UserRoleEnum.KEPALA_SEKOLAH,
-                User.deleted_at.is_(None),
+        query = (
+            select(User)
+            .options(load_only(*_USER_LISTING_COLUMNS))
+            .where(
+                and_(
+                    User.organization_id == organization_id,
+                    User.role == UserRoleEnum.KEPALA_SEKOLAH,
+                    User.deleted_at.is_(None),
+                )
             )
         )
         result = await self.session.execute(query)
@@ -361,16 +669,33 @@ class UserRepository:
 
     async def get_teachers_count_by_organization(self, organization_id: int) -> int:
         """Count teachers (guru) in specific organization."""
-        query = select(func.count(User.id)).where(
-            and_(
-                User.organization_id == organization_id,
-                User.role == UserRoleEnum.GURU,
-                User.deleted_at.is_(None),
-                User.status == UserStatus.ACTIVE,
+        result = await self.session.execute(
+            _COUNT_ACTIVE_TEACHERS_BY_ORGANIZATION, {"organization_id": organization_id}
+        )
+        return result.scalar() or 0
+
+    async def get_teachers_count_by_organizations(
+        self, organization_ids: List[int]
+    ) -> Dict[int, int]:
+        """Count active teachers (guru) for several organizations in one query."""
+        if not organization_ids:
+            return {}
+
+        query = (
+            select(User.organization_id, func.count(User.id))
+            .where(
+                and_(
+                    User.organization_id.in_(organization_ids),
+                    User.role == UserRoleEnum.GURU,
+                    User.deleted_at.is_(None),
+                    User.status == UserStatus.ACTIVE,
+                )
             )
+            .group_by(User.organization_id)
         )
         result = await self.session.execute(query)
-        return result.scalar() or 0
+        counts = dict(result.all())
+        return {org_id: counts.get(org_id, 0) for org_id in organization_ids}
 
     async def get_user_count(self) -> int:
         """Get total count of active users."""
@@ -403,19 +728,76 @@ class UserRepository:
         query = (
             update(PasswordResetToken)
             .where(PasswordResetToken.id == token_id)
-            .values(used=True, used_at=datetime.utcnow())
+            .values(used=True, used_at=UTC_NOW)
+            .returning(PasswordResetToken)
+            .execution_options(populate_existing=True)
         )
-        await self.session.execute(query)
+        result = await self.session.execute(query)
+        result.scalar_one_or_none()
         await self.session.commit()
 
-    async def cleanup_expired_tokens(self) -> int:
-        """Clean up expired password reset tokens."""
-        query = delete(PasswordResetToken).where(
-            or_(
-                PasswordResetToken.expires_at < datetime.utcnow(),
-                PasswordResetToken.used == True,
+    async def reset_password_with_token(
+        self, user_id: int, hashed_password: str, token_id: str
+    ) -> bool:
+        """Consume a reset token and set the new password in one transaction.
+
+        Returns False, without changing anything, if the token was already used.
+        """
+        token_query = (
+            update(PasswordResetToken)
+            .where(
+                and_(
+                    PasswordResetToken.id == token_id,
+                    PasswordResetToken.used == False,
+                )
             )
+            .values(used=True, used_at=UTC_NOW)
+            .returning(PasswordResetToken)
+            .execution_options(populate_existing=True)
         )
-        result = await self.session.execute(query)
+        token_result = await self.session.execute(token_query)
+        if token_result.scalar_one_or_none() is None:
+            await self.session.rollback()
+            return False
+
+        password_query = (
+            update(User)
+            .where(User.id == user_id)
+            .values(password=hashed_password, updated_at=UTC_NOW)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(password_query)
+        result.scalar_one_or_none()
         await self.session.commit()
-        return result.rowcount
+        _invalidate_cached_user(user_id)
+        return True
+
+    async def cleanup_expired_tokens(self, batch_size: int = 1000) -> int:
+        """Clean up expired password reset tokens in small batches."""
+        expired_ids = (
+            select(PasswordResetToken.id)
+            .where(
+                or_(
+                    PasswordResetToken.expires_at < UTC_NOW,
+                    PasswordResetToken.used == True,
+                )
+            )
+            .limit(batch_size)
+        )
+        query = (
+            delete(PasswordResetToken)
+            .where(PasswordResetToken.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+        # Commit per batch so each DELETE holds its row locks only briefly
+        total_deleted = 0
+        while True:
+            result = await self.session.execute(query)
+            await self.session.commit()
+            total_deleted += result.rowcount
+            if result.rowcount < batch_size:
+                break
+
+        return total_deleted
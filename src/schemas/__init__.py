@@ -32,6 +32,10 @@ from .user import (
     UserFilterParams,
     UsernameGenerationPreview,
     UsernameGenerationResponse,
+)
+
+# Base filter schemas
+from .filters import (
     PaginationParams,
     SearchParams,
     DateRangeFilter,
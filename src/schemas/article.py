@@ -1,45 +1,31 @@
 """Article schemas for request/response."""
 
-from typing import Optional, List
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Annotated, Literal, Optional, List
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, computed_field
 from datetime import datetime
 
-from src.schemas.shared import BaseListResponse
+from src.schemas.shared import BaseListResponse, SLUG_PATTERN, SortOrder
+
+
+# Normalization runs inside pydantic-core instead of per-field Python validators
+_Title = Annotated[str, StringConstraints(strip_whitespace=True)]
+_Category = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True)]
+
+ArticleSortBy = Literal["created_at", "updated_at", "published_at", "title", "category"]
 
 
 # ===== BASE SCHEMAS =====
 
 class ArticleBase(BaseModel):
     """Base article schema."""
-    title: str = Field(..., min_length=1, max_length=255, description="Article title")
+    title: _Title = Field(..., min_length=1, max_length=255, description="Article title")
     description: str = Field(..., min_length=1, description="Full article content")
-    slug: str = Field(..., min_length=1, max_length=255, description="URL-friendly slug")
+    slug: str = Field(..., min_length=1, max_length=255, pattern=SLUG_PATTERN, description="URL-friendly slug")
     excerpt: Optional[str] = Field(None, max_length=500, description="Short summary")
     img_url: Optional[str] = Field(None, max_length=500, description="Article image URL")
-    category: str = Field(..., min_length=1, max_length=100, description="Article category")
+    category: _Category = Field(..., min_length=1, max_length=100, description="Article category")
     is_published: bool = Field(default=False, description="Publication status")
     published_at: Optional[datetime] = Field(None, description="Publication date")
-    
-    @field_validator('slug')
-    @classmethod
-    def validate_slug(cls, slug: str) -> str:
-        """Validate slug format."""
-        import re
-        if not re.match(r'^[a-z0-9-]+$', slug):
-            raise ValueError("Slug must contain only lowercase letters, numbers, and hyphens")
-        return slug.lower().strip()
-    
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, title: str) -> str:
-        """Validate and clean title."""
-        return title.strip()
-    
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, category: str) -> str:
-        """Validate and clean category."""
-        return category.strip().lower()
 
 
 # ===== REQUEST SCHEMAS =====
@@ -51,37 +37,14 @@ class ArticleCreate(ArticleBase):
 
 class ArticleUpdate(BaseModel):
     """Schema for updating an article."""
-    title: Optional[str] = Field(None, min_length=1, max_length=255)
+    title: Optional[_Title] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = Field(None, min_length=1)
-    slug: Optional[str] = Field(None, min_length=1, max_length=255)
+    slug: Optional[str] = Field(None, min_length=1, max_length=255, pattern=SLUG_PATTERN)
     excerpt: Optional[str] = Field(None, max_length=500)
     img_url: Optional[str] = Field(None, max_length=500)
-    category: Optional[str] = Field(None, min_length=1, max_length=100)
+    category: Optional[_Category] = Field(None, min_length=1, max_length=100)
     is_published: Optional[bool] = None
     published_at: Optional[datetime] = None
-    
-    @field_validator('slug')
-    @classmethod
-    def validate_slug(cls, slug: Optional[str]) -> Optional[str]:
-        """Validate slug format if provided."""
-        if slug:
-            import re
-            if not re.match(r'^[a-z0-9-]+$', slug):
-                raise ValueError("Slug must contain only lowercase letters, numbers, and hyphens")
-            return slug.lower().strip()
-        return slug
-    
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, title: Optional[str]) -> Optional[str]:
-        """Validate and clean title if provided."""
-        return title.strip() if title else None
-    
-    @field_validator('category')
-    @classmethod
-    def validate_category(cls, category: Optional[str]) -> Optional[str]:
-        """Validate and clean category if provided."""
-        return category.strip().lower() if category else None
 
 
 # ===== RESPONSE SCHEMAS =====
@@ -103,13 +66,29 @@ class ArticleResponse(BaseModel):
     updated_by: Optional[int] = None
     
     # Computed fields
-    is_draft: bool = Field(..., description="Whether article is a draft")
-    display_excerpt: str = Field(..., description="Excerpt or truncated description")
+    @computed_field(description="Excerpt or truncated description")
+    @property
+    def display_excerpt(self) -> str:
+        """Excerpt or truncated description (mirrors Article.get_excerpt)."""
+        if self.excerpt:
+            return self.excerpt
+        if self.description:
+            return (self.description[:150] + "...") if len(self.description) > 150 else self.description
+        return ""
+    
+    @computed_field(description="Whether article is a draft")
+    @property
+    def is_draft(self) -> bool:
+        """Check if article is a draft (mirrors Article.is_draft)."""
+        return not self.is_published or self.published_at is None
     
     @classmethod
     def from_article_model(cls, article) -> "ArticleResponse":
-        """Create ArticleResponse from Article model."""
-        return cls(
+        """Create ArticleResponse from Article model.
+
+        The values come straight from a persisted row, so validation is skipped.
+        """
+        return cls.model_construct(
             id=article.id,
             title=article.title,
             description=article.description,
@@ -122,12 +101,10 @@ class ArticleResponse(BaseModel):
             created_at=article.created_at,
             updated_at=article.updated_at,
             created_by=article.created_by,
-            updated_by=article.updated_by,
-            is_draft=article.is_draft,
-            display_excerpt=article.get_excerpt()
+            updated_by=article.updated_by
         )
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ArticleListResponse(BaseListResponse[ArticleResponse]):
@@ -136,7 +113,11 @@ class ArticleListResponse(BaseListResponse[ArticleResponse]):
 
 
 class ArticleSummary(BaseModel):
-    """Schema for article summary (lighter response)."""
+    """Schema for article summary (lighter response).
+
+    Every field maps to an Article column; ArticleRepository.get_summaries_filtered
+    loads only these columns, so the article body never leaves the database.
+    """
     id: int
     title: str
     slug: str
@@ -149,8 +130,8 @@ class ArticleSummary(BaseModel):
     
     @classmethod
     def from_article_model(cls, article) -> "ArticleSummary":
-        """Create ArticleSummary from Article model."""
-        return cls(
+        """Create ArticleSummary from Article model (trusted row, no validation)."""
+        return cls.model_construct(
             id=article.id,
             title=article.title,
             slug=article.slug,
@@ -162,7 +143,7 @@ class ArticleSummary(BaseModel):
             created_at=article.created_at
         )
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ===== FILTER SCHEMAS =====
@@ -180,12 +161,14 @@ class ArticleFilterParams(BaseModel):
     is_published: Optional[bool] = Field(default=None, description="Filter by publication status")
     
     # Sorting
-    sort_by: str = Field(default="created_at", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
+    sort_by: ArticleSortBy = Field(default="created_at", description="Sort field")
+    sort_order: SortOrder = Field(default="desc", description="Sort order")
     
     # Date filtering
     published_after: Optional[datetime] = Field(default=None, description="Filter articles published after this date")
     published_before: Optional[datetime] = Field(default=None, description="Filter articles published before this date")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 # ===== ACTION SCHEMAS =====
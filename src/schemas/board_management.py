@@ -1,10 +1,17 @@
 """Board management schemas for API request/response."""
 
-from typing import Optional, List
+from typing import Annotated, Any, Literal, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict, field_validator, computed_field
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, model_validator
 
-from .shared import BaseListResponse
+from .shared import BaseListResponse, SortOrder
+
+
+# Whitespace is stripped inside pydantic-core instead of per-field Python validators
+_StrippedStr = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+BoardGroupSortBy = Literal["display_order", "title", "created_at", "updated_at"]
+BoardMemberSortBy = Literal["member_order", "name", "position", "created_at", "updated_at"]
 
 
 # ===== BOARD GROUP SCHEMAS =====
@@ -34,8 +41,7 @@ class BoardGroupResponse(BoardGroupBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BoardGroupFilterParams(BaseModel):
@@ -43,8 +49,10 @@ class BoardGroupFilterParams(BaseModel):
     page: int = Field(default=1, ge=1, description="Page number")
     size: int = Field(default=10, ge=1, le=100, description="Items per page")
     search: Optional[str] = Field(None, description="Search in title or description")
-    sort_by: str = Field("display_order", description="Sort field")
-    sort_order: str = Field("asc", pattern="^(asc|desc)$", description="Sort order")
+    sort_by: BoardGroupSortBy = Field("display_order", description="Sort field")
+    sort_order: SortOrder = Field("asc", description="Sort order")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class BoardGroupListResponse(BaseListResponse[BoardGroupResponse]):
@@ -56,24 +64,12 @@ class BoardGroupListResponse(BaseListResponse[BoardGroupResponse]):
 
 class BoardMemberBase(BaseModel):
     """Base board member schema."""
-    name: str = Field(..., min_length=1, max_length=255, description="Board member name")
-    position: str = Field(..., min_length=1, max_length=255, description="Position/title in the board")
+    name: _StrippedStr = Field(..., min_length=1, max_length=255, description="Board member name")
+    position: _StrippedStr = Field(..., min_length=1, max_length=255, description="Position/title in the board")
     group_id: Optional[int] = Field(None, description="Board group ID")
     member_order: int = Field(default=1, ge=1, description="Order within the group")
     img_url: Optional[str] = Field(None, max_length=500, description="Profile image URL")
     description: Optional[str] = Field(None, description="Bio or description")
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, name: str) -> str:
-        """Validate and clean name."""
-        return name.strip()
-    
-    @field_validator('position')
-    @classmethod
-    def validate_position(cls, position: str) -> str:
-        """Validate and clean position."""
-        return position.strip()
 
 
 class BoardMemberCreate(BoardMemberBase):
@@ -83,24 +79,12 @@ class BoardMemberCreate(BoardMemberBase):
 
 class BoardMemberUpdate(BaseModel):
     """Schema for updating a board member."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
-    position: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[_StrippedStr] = Field(None, min_length=1, max_length=255)
+    position: Optional[_StrippedStr] = Field(None, min_length=1, max_length=255)
     group_id: Optional[int] = Field(None, description="Board group ID")
     member_order: Optional[int] = Field(None, ge=1, description="Order within the group")
     img_url: Optional[str] = Field(None, max_length=500)
     description: Optional[str] = None
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, name: Optional[str]) -> Optional[str]:
-        """Validate and clean name if provided."""
-        return name.strip() if name else None
-    
-    @field_validator('position')
-    @classmethod
-    def validate_position(cls, position: Optional[str]) -> Optional[str]:
-        """Validate and clean position if provided."""
-        return position.strip() if position else None
 
 
 class BoardMemberResponse(BaseModel):
@@ -116,16 +100,20 @@ class BoardMemberResponse(BaseModel):
     updated_at: Optional[datetime] = None
     created_by: Optional[int] = None
     updated_by: Optional[int] = None
+    short_description: str = ""
     
-    @computed_field
-    @property
-    def short_description(self) -> str:
-        """Get shortened description."""
-        if not self.description:
-            return ""
-        return (self.description[:100] + "...") if len(self.description) > 100 else self.description
+    @model_validator(mode='before')
+    @classmethod
+    def fill_short_description(cls, data: Any) -> Any:
+        """Truncate the description once at construction instead of on every dump."""
+        # ORM instances already supply it through BoardMember.short_description
+        if not isinstance(data, dict) or "short_description" in data:
+            return data
+        description = data.get("description") or ""
+        short_description = (description[:100] + "...") if len(description) > 100 else description
+        return {**data, "short_description": short_description}
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class BoardMemberListResponse(BaseListResponse[BoardMemberResponse]):
@@ -138,5 +126,7 @@ class BoardMemberFilterParams(BaseModel):
     page: int = Field(default=1, ge=1, description="Page number")
     size: int = Field(default=10, ge=1, le=100, description="Items per page")
     search: Optional[str] = Field(default=None, description="Search in name or position")
-    sort_by: str = Field(default="member_order", description="Sort field")
-    sort_order: str = Field(default="asc", pattern="^(asc|desc)$", description="Sort order")
\ No newline at end of file
+    sort_by: BoardMemberSortBy = Field(default="member_order", description="Sort field")
+    sort_order: SortOrder = Field(default="asc", description="Sort order")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
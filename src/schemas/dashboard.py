@@ -1,11 +1,15 @@
 """Dashboard schemas for PKG system."""
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from datetime import datetime
 
 
-class RPPDashboardStats(BaseModel):
+# Leaf stats are plain value objects built once per response; slotted
+# dataclasses avoid a per-instance __dict__ on the per-organization lists.
+@dataclass(slots=True)
+class RPPDashboardStats:
     """RPP submission statistics for dashboard."""
     total_submissions: int = Field(description="Total number of RPP submissions")
     pending_submissions: int = Field(description="Number of pending submissions")
@@ -16,7 +20,8 @@ class RPPDashboardStats(BaseModel):
     submission_rate: float = Field(description="Submission completion rate percentage")
     
 
-class TeacherEvaluationDashboardStats(BaseModel):
+@dataclass(slots=True)
+class TeacherEvaluationDashboardStats:
     """Teacher evaluation statistics for dashboard."""
     total_evaluations: int = Field(description="Total number of evaluations")
     avg_score: Optional[float] = Field(description="Average evaluation score")
@@ -36,7 +41,8 @@ class OrganizationSummary(BaseModel):
     evaluation_stats: TeacherEvaluationDashboardStats = Field(description="Evaluation statistics for this organization")
 
 
-class PeriodSummary(BaseModel):
+@dataclass(slots=True)
+class PeriodSummary:
     """Period summary information."""
     period_id: int = Field(description="Period ID")
     period_name: str = Field(description="Period name")
@@ -45,6 +51,36 @@ class PeriodSummary(BaseModel):
     is_active: bool = Field(description="Whether the period is currently active")
 
 
+class OrganizationOverview(BaseModel):
+    """Organization overview for principal dashboard."""
+    organization_name: str = Field(description="Organization name")
+    total_teachers: int = Field(description="Number of teachers in organization")
+    active_teachers: int = Field(description="Number of active teachers in organization")
+    head_name: str = Field(description="Name of the organization head")
+
+
+class TeacherSummary(BaseModel):
+    """Per-teacher RPP summary for principal dashboard."""
+    teacher_id: int = Field(description="Teacher user ID")
+    teacher_name: str = Field(description="Teacher name")
+    total_rpps: int = Field(description="Number of submitted RPPs")
+    approved_rpps: int = Field(description="Number of approved RPPs")
+    completion_rate: float = Field(description="RPP completion rate percentage")
+
+
+class SystemOverview(BaseModel):
+    """System-wide overview for admin dashboard."""
+    total_users: int = Field(description="Total number of users")
+    total_organizations: int = Field(description="Total number of organizations")
+    system_health: str = Field(description="Overall system health indicator")
+
+
+class SystemActivity(BaseModel):
+    """Recent system activity entry for admin dashboard."""
+    type: str = Field(description="Activity type")
+    message: str = Field(description="Activity description")
+
+
 class DashboardResponse(BaseModel):
     """Main dashboard response containing all statistics."""
     period: Optional[PeriodSummary] = Field(description="Current period information")
@@ -61,25 +97,30 @@ class DashboardFilters(BaseModel):
     period_id: Optional[int] = Field(None, description="Filter by specific period")
     organization_id: Optional[int] = Field(None, description="Filter by organization (admin only)")
     include_inactive: bool = Field(False, description="Include inactive periods/organizations")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
-class TeacherDashboard(DashboardResponse):
-    """Teacher-specific dashboard with personal statistics."""
+class PersonalDashboard(DashboardResponse):
+    """Dashboard fields shared by users who submit RPPs and receive evaluations."""
     my_rpp_stats: RPPDashboardStats = Field(description="Personal RPP submission statistics")
     my_evaluation_stats: TeacherEvaluationDashboardStats = Field(description="Personal evaluation statistics")
 
 
-class PrincipalDashboard(DashboardResponse):
+class TeacherDashboard(PersonalDashboard):
+    """Teacher-specific dashboard with personal statistics."""
+    pass
+
+
+class PrincipalDashboard(PersonalDashboard):
     """Principal-specific dashboard with organization statistics."""
-    my_rpp_stats: RPPDashboardStats = Field(description="Personal RPP submission statistics")
-    my_evaluation_stats: TeacherEvaluationDashboardStats = Field(description="Personal evaluation statistics")
-    organization_overview: Dict[str, Any] = Field(description="Detailed organization overview")
-    teacher_summaries: List[Dict[str, Any]] = Field(description="Summary of teachers in organization")
+    organization_overview: Optional[OrganizationOverview] = Field(description="Detailed organization overview")
+    teacher_summaries: List[TeacherSummary] = Field(description="Summary of teachers in organization")
 
 
 class AdminDashboard(DashboardResponse):
     """Admin-specific dashboard with system-wide statistics."""
-    system_overview: Dict[str, Any] = Field(description="System-wide overview statistics")
+    system_overview: SystemOverview = Field(description="System-wide overview statistics")
     organization_summaries: List[OrganizationSummary] = Field(description="All organizations summary")
     organization_distribution: Dict[str, Dict[str, int]] = Field(description="Grade distribution per organization")
-    recent_system_activities: List[Dict[str, Any]] = Field(description="Recent system-wide activities")
\ No newline at end of file
+    recent_system_activities: List[SystemActivity] = Field(description="Recent system-wide activities")
\ No newline at end of file
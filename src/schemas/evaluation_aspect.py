@@ -1,29 +1,28 @@
 """Evaluation Aspect schemas for PKG System API endpoints - Simplified."""
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
-from datetime import datetime, date
+from typing import Annotated, List, Literal, Optional, Dict, Tuple
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, TypeAdapter, field_validator
+from datetime import datetime, date, time
 
-from src.schemas.shared import BaseListResponse
-from typing import Optional
-from pydantic import Field
+from src.schemas.shared import SortOrder
+from src.schemas.filters import PaginationParams, SearchParams
+
+
+# Stripping runs inside pydantic-core instead of a per-field Python validator
+_AspectName = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+EvaluationAspectSortBy = Literal["aspect_name", "display_order", "is_active", "created_at", "updated_at"]
 
 
 # ===== BASE SCHEMAS =====
 
 class EvaluationAspectBase(BaseModel):
     """Base evaluation aspect schema - simplified without weights and scores."""
-    aspect_name: str = Field(..., min_length=1, max_length=255, description="Name of evaluation aspect")
+    aspect_name: _AspectName = Field(..., min_length=1, max_length=255, description="Name of evaluation aspect")
     category_id: int = Field(..., ge=1, description="ID of the evaluation category")
     description: Optional[str] = Field(None, description="Detailed description of the aspect")
     display_order: int = Field(default=1, ge=1, description="Display order within category")
     is_active: bool = Field(default=True, description="Whether aspect is active")
-    
-    @field_validator('aspect_name')
-    @classmethod
-    def validate_aspect_name(cls, name: str) -> str:
-        """Validate and normalize aspect name."""
-        return name.strip()
 
 
 # ===== REQUEST SCHEMAS =====
@@ -35,22 +34,16 @@ class EvaluationAspectCreate(EvaluationAspectBase):
 
 class EvaluationAspectUpdate(BaseModel):
     """Schema for updating an evaluation aspect."""
-    aspect_name: Optional[str] = Field(None, min_length=1, max_length=255)
+    aspect_name: Optional[_AspectName] = Field(None, min_length=1, max_length=255)
     category_id: Optional[int] = Field(None, ge=1)
     description: Optional[str] = None
     display_order: Optional[int] = Field(None, ge=1)
     is_active: Optional[bool] = None
-    
-    @field_validator('aspect_name')
-    @classmethod
-    def validate_aspect_name(cls, name: Optional[str]) -> Optional[str]:
-        """Validate and normalize aspect name if provided."""
-        return name.strip() if name else None
 
 
 class EvaluationAspectBulkCreate(BaseModel):
     """Schema for bulk creating evaluation aspects."""
-    aspects: List[EvaluationAspectCreate] = Field(..., min_items=1, description="List of aspects to create")
+    aspects: Tuple[EvaluationAspectCreate, ...] = Field(..., min_length=1, description="List of aspects to create")
 
 
 # ===== RESPONSE SCHEMAS =====
@@ -71,85 +64,57 @@ class EvaluationAspectResponse(BaseModel):
     evaluation_count: int = Field(default=0, description="Number of evaluations using this aspect")
     
     @classmethod
-    def from_evaluation_aspect_model(cls, aspect, include_stats: bool = False) -> "EvaluationAspectResponse":
-        """Create EvaluationAspectResponse from EvaluationAspect model."""
-        # Safely get category name
-        category_name = None
-        if hasattr(aspect, 'category') and aspect.category:
-            try:
-                category_name = aspect.category.name
-            except:
-                category_name = None
-        
-        data = {
-            "id": aspect.id,
-            "aspect_name": aspect.aspect_name,
-            "category_id": aspect.category_id,
-            "category_name": category_name,
-            "description": aspect.description,
-            "display_order": aspect.display_order,
-            "is_active": aspect.is_active,
-            "created_at": aspect.created_at,
-            "updated_at": aspect.updated_at,
-        }
-        
-        if include_stats:
-            # These would be calculated in the repository/service layer
-            data.update({
-                "evaluation_count": getattr(aspect, 'evaluation_count', 0),
-            })
-        
-        return cls(**data)
-    
-    model_config = {"from_attributes": True}
-
-
-class EvaluationAspectListResponse(BaseListResponse[EvaluationAspectResponse]):
-    """Standardized evaluation aspect list response."""
-    pass
+    def from_evaluation_aspect_model(cls, aspect, evaluation_count: int = 0) -> "EvaluationAspectResponse":
+        """Create EvaluationAspectResponse from EvaluationAspect model.
 
-
-class EvaluationAspectSummary(BaseModel):
-    """Schema for evaluation aspect summary (lighter response)."""
-    id: int
-    aspect_name: str
-    category: str
-    is_active: bool
-    created_at: datetime
-    
-    # Statistics
-    evaluation_count: int = Field(default=0)
-    
-    @classmethod
-    def from_evaluation_aspect_model(cls, aspect) -> "EvaluationAspectSummary":
-        """Create EvaluationAspectSummary from EvaluationAspect model."""
-        return cls(
+        The values come straight from a persisted row, so validation is skipped.
+        """
+        category_name = getattr(getattr(aspect, 'category', None), 'name', None)
+        
+        return cls.model_construct(
             id=aspect.id,
             aspect_name=aspect.aspect_name,
-            category=aspect.category,
+            category_id=aspect.category_id,
+            category_name=category_name,
+            description=aspect.description,
+            display_order=aspect.display_order,
             is_active=aspect.is_active,
             created_at=aspect.created_at,
-            evaluation_count=getattr(aspect, 'evaluation_count', 0)
+            updated_at=aspect.updated_at,
+            # Counted in bulk by the repository, not per row here
+            evaluation_count=evaluation_count,
         )
     
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
-# ===== BASE FILTER SCHEMAS =====
+# Built once at import; aspect endpoints serialize through these directly
+_ASPECT_LIST_ADAPTER = TypeAdapter(List[EvaluationAspectResponse])
+
+
+def dump_aspect(aspect: EvaluationAspectResponse) -> bytes:
+    """Serialize a single aspect response straight to JSON bytes."""
+    return EvaluationAspectResponse.__pydantic_serializer__.to_json(aspect)
 
-class PaginationParams(BaseModel):
-    """Base pagination parameters."""
-    
-    page: int = Field(default=1, ge=1, description="Page number")
-    size: int = Field(default=10, ge=1, le=100, description="Items per page")
 
+def dump_aspect_list(aspects: List[EvaluationAspectResponse]) -> bytes:
+    """Serialize a list of aspect responses straight to JSON bytes."""
+    return _ASPECT_LIST_ADAPTER.dump_json(aspects)
 
-class SearchParams(BaseModel):
-    """Base search parameters."""
+
+class EvaluationAspectListResponse(BaseModel):
+    """Standardized evaluation aspect list response.
+
+    Declared concretely (same fields as BaseListResponse) so only one
+    schema is built instead of the generic parametrization plus subclass.
+    """
+    items: List[EvaluationAspectResponse] = Field(..., description="List of items")
+    total: int = Field(..., description="Total number of items")
+    page: int = Field(..., description="Current page number")
+    size: int = Field(..., description="Items per page")
+    pages: int = Field(..., description="Total number of pages")
     
-    q: Optional[str] = Field(default=None, description="Search query")
-    sort_by: str = Field(default="created_at", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
+    model_config = ConfigDict(frozen=True)
 
 
 # ===== FILTER SCHEMAS =====
@@ -170,20 +135,35 @@ class EvaluationAspectFilterParams(PaginationParams, SearchParams):
     q: Optional[str] = Field(None, description="Search in aspect name or description")
     
     # Override default sort
-    sort_by: str = Field(default="display_order", description="Sort field (aspect_name, display_order, is_active, created_at, updated_at)")
+    sort_by: EvaluationAspectSortBy = Field(default="display_order", description="Sort field")
+    sort_order: SortOrder = Field(default="desc", description="Sort order")
+    
+    @property
+    def created_after_at(self) -> Optional[datetime]:
+        """Start of the created_after day."""
+        if self.created_after is None:
+            return None
+        return datetime.combine(self.created_after, time.min)
+    
+    @property
+    def created_before_at(self) -> Optional[datetime]:
+        """End of the created_before day."""
+        if self.created_before is None:
+            return None
+        return datetime.combine(self.created_before, time.max)
 
 
 # ===== BULK OPERATIONS =====
 
 class EvaluationAspectBulkUpdate(BaseModel):
     """Schema for bulk evaluation aspect updates."""
-    aspect_ids: List[int] = Field(..., min_items=1, description="List of aspect IDs to update")
+    aspect_ids: Tuple[int, ...] = Field(..., min_length=1, max_length=1000, description="List of aspect IDs to update")
     is_active: Optional[bool] = None
 
 
 class EvaluationAspectBulkDelete(BaseModel):
     """Schema for bulk evaluation aspect deletion."""
-    aspect_ids: List[int] = Field(..., min_items=1, description="List of aspect IDs to delete")
+    aspect_ids: Tuple[int, ...] = Field(..., min_length=1, max_length=1000, description="List of aspect IDs to delete")
     force_delete: bool = Field(default=False, description="Force delete even if aspect has evaluations")
 
 
@@ -198,29 +178,79 @@ class AspectOrderUpdate(BaseModel):
 class CategoryAspectsReorder(BaseModel):
     """Schema for reordering aspects within a category."""
     category_id: int = Field(..., ge=1, description="Category ID")
-    aspect_orders: Dict[int, int] = Field(..., description="Mapping of aspect_id to new_order")
+    aspect_orders: List[Tuple[Annotated[int, Field(ge=1)], Annotated[int, Field(ge=1)]]] = Field(
+        ..., min_length=1, description="List of (aspect_id, new_order) pairs"
+    )
+    
+    @field_validator('aspect_orders')
+    @classmethod
+    def validate_unique_aspects(cls, aspect_orders: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Reject payloads that order the same aspect twice."""
+        if len({aspect_id for aspect_id, _ in aspect_orders}) != len(aspect_orders):
+            raise ValueError("Each aspect may only appear once in aspect_orders")
+        return aspect_orders
 
 
-# Import category schemas for combined responses
 class CategoryWithAspectsResponse(BaseModel):
     """Schema for category with its aspects."""
     id: int
     name: str
     display_order: int
     is_active: bool
-    aspects: List["EvaluationAspectResponse"] = []
+    aspects: List[EvaluationAspectResponse] = Field(default_factory=list)
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 # ===== ANALYTICS SCHEMAS =====
 
+class AspectUsageEntry(BaseModel):
+    """Usage summary of a single aspect in analytics listings."""
+    aspect_id: int
+    aspect_name: str
+    evaluation_count: int
+    avg_score: float = 0.0
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+class GradeDistribution(BaseModel):
+    """Count of evaluations per grade; field names follow EvaluationGrade."""
+    A: int = 0
+    B: int = 0
+    C: int = 0
+    D: int = 0
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+class TrendPoint(BaseModel):
+    """Single point of an aspect performance trend."""
+    period: str
+    value: int
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+class PerformerEntry(BaseModel):
+    """Teacher performance entry for a single aspect."""
+    teacher_id: int
+    teacher_name: str
+    avg_grade: str
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
 class EvaluationAspectAnalytics(BaseModel):
     """Schema for evaluation aspect analytics - simplified."""
     total_aspects: int
     active_aspects: int
     inactive_aspects: int
-    most_used_aspects: List[Dict[str, Any]] = Field(description="Most frequently evaluated aspects")
-    least_used_aspects: List[Dict[str, Any]] = Field(description="Least frequently evaluated aspects")
+    most_used_aspects: List[AspectUsageEntry] = Field(description="Most frequently evaluated aspects")
+    least_used_aspects: List[AspectUsageEntry] = Field(description="Least frequently evaluated aspects")
     avg_grade_by_aspect: Dict[str, str] = Field(description="Average grades per aspect")
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class AspectPerformanceAnalysis(BaseModel):
@@ -229,10 +259,12 @@ class AspectPerformanceAnalysis(BaseModel):
     aspect_name: str
     total_evaluations: int
     avg_grade: str = Field(description="Average grade (A, B, C, D)")
-    grade_distribution: Dict[str, int] = Field(description="Grade distribution (A, B, C, D)")
-    trend_data: List[Dict[str, Any]] = Field(description="Performance trend over time")
-    top_performers: List[Dict[str, Any]] = Field(description="Top performing teachers in this aspect")
-    improvement_needed: List[Dict[str, Any]] = Field(description="Teachers needing improvement")
+    grade_distribution: GradeDistribution = Field(description="Grade distribution (A, B, C, D)")
+    trend_data: List[TrendPoint] = Field(description="Performance trend over time")
+    top_performers: List[PerformerEntry] = Field(description="Top performing teachers in this aspect")
+    improvement_needed: List[PerformerEntry] = Field(description="Teachers needing improvement")
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 class EvaluationAspectStats(BaseModel):
@@ -240,4 +272,11 @@ class EvaluationAspectStats(BaseModel):
     summary: EvaluationAspectAnalytics
     aspect_performance: List[AspectPerformanceAnalysis]
     usage_trends: Dict[str, List[int]] = Field(description="Usage trends over time")
-    recommendations: List[str] = Field(description="System recommendations for aspect management")
\ No newline at end of file
+    recommendations: List[str] = Field(description="System recommendations for aspect management")
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+def dump_aspect_stats(stats: EvaluationAspectStats) -> bytes:
+    """Serialize the whole analytics report, nested lists included, in one pass."""
+    return EvaluationAspectStats.__pydantic_serializer__.to_json(stats)
@@ -1,26 +1,41 @@
 """EvaluationCategory schemas for PKG System API endpoints."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints, TypeAdapter, model_validator
 from datetime import datetime
 
-from src.schemas.shared import BaseListResponse
+from src.schemas.shared import BaseListResponse, SortOrder
+from src.schemas.filters import PaginationParams, SearchParams
+
+
+# Stripping runs inside pydantic-core instead of a per-field Python validator
+_CategoryName = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+_MAX_BULK_CATEGORY_IDS = 1000
+
+
+def _cap_submitted_ids(value: Any) -> Any:
+    """Reject oversized id lists before duplicates collapse into the set."""
+    if isinstance(value, (list, tuple, set, frozenset)) and len(value) > _MAX_BULK_CATEGORY_IDS:
+        raise ValueError(f"At most {_MAX_BULK_CATEGORY_IDS} category IDs can be submitted")
+    return value
+
+
+_BulkCategoryIds = Annotated[
+    FrozenSet[int],
+    BeforeValidator(_cap_submitted_ids),
+    Field(min_length=1, max_length=_MAX_BULK_CATEGORY_IDS),
+]
 
 
 # ===== BASE SCHEMAS =====
 
 class EvaluationCategoryBase(BaseModel):
     """Base evaluation category schema."""
-    name: str = Field(..., min_length=1, max_length=100, description="Category name")
+    name: _CategoryName = Field(..., min_length=1, max_length=100, description="Category name")
     description: Optional[str] = Field(None, description="Category description")
     display_order: int = Field(default=1, ge=1, description="Display order")
     is_active: bool = Field(default=True, description="Whether category is active")
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, name: str) -> str:
-        """Validate and normalize category name."""
-        return name.strip()
 
 
 # ===== REQUEST SCHEMAS =====
@@ -32,16 +47,10 @@ class EvaluationCategoryCreate(EvaluationCategoryBase):
 
 class EvaluationCategoryUpdate(BaseModel):
     """Schema for updating an evaluation category."""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    name: Optional[_CategoryName] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
     display_order: Optional[int] = Field(None, ge=1)
     is_active: Optional[bool] = None
-    
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, name: Optional[str]) -> Optional[str]:
-        """Validate and normalize category name if provided."""
-        return name.strip() if name else None
 
 
 # ===== RESPONSE SCHEMAS =====
@@ -61,27 +70,44 @@ class EvaluationCategoryResponse(BaseModel):
     active_aspects_count: int = Field(default=0, description="Number of active aspects in this category")
     
     @classmethod
-    def from_evaluation_category_model(cls, category, include_stats: bool = False) -> "EvaluationCategoryResponse":
-        """Create EvaluationCategoryResponse from EvaluationCategory model."""
-        data = {
-            "id": category.id,
-            "name": category.name,
-            "description": category.description,
-            "display_order": category.display_order,
-            "is_active": category.is_active,
-            "created_at": category.created_at,
-            "updated_at": category.updated_at,
-        }
-        
-        if include_stats:
-            data.update({
-                "aspects_count": getattr(category, 'aspects_count', 0),
-                "active_aspects_count": getattr(category, 'active_aspects_count', 0),
-            })
-        
-        return cls(**data)
+    def from_evaluation_category_model(
+        cls,
+        category,
+        aspects_count: int = 0,
+        active_aspects_count: int = 0
+    ) -> "EvaluationCategoryResponse":
+        """Create EvaluationCategoryResponse from EvaluationCategory model.
+
+        The values come straight from a persisted row, so validation is skipped.
+        """
+        return cls.model_construct(
+            id=category.id,
+            name=category.name,
+            description=category.description,
+            display_order=category.display_order,
+            is_active=category.is_active,
+            created_at=category.created_at,
+            updated_at=category.updated_at,
+            # Counted by the repository, not probed on the row here
+            aspects_count=aspects_count,
+            active_aspects_count=active_aspects_count,
+        )
     
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
+
+# Built once at import; category endpoints serialize through these directly
+_CATEGORY_LIST_ADAPTER = TypeAdapter(List[EvaluationCategoryResponse])
+
+
+def dump_category(category: EvaluationCategoryResponse) -> bytes:
+    """Serialize a single category response straight to JSON bytes."""
+    return EvaluationCategoryResponse.__pydantic_serializer__.to_json(category)
+
+
+def dump_category_list(categories: List[EvaluationCategoryResponse]) -> bytes:
+    """Serialize a list of category responses straight to JSON bytes."""
+    return _CATEGORY_LIST_ADAPTER.dump_json(categories)
 
 
 class EvaluationCategoryListResponse(BaseListResponse[EvaluationCategoryResponse]):
@@ -98,17 +124,17 @@ class EvaluationCategorySummary(BaseModel):
     aspects_count: int = Field(default=0)
     
     @classmethod
-    def from_evaluation_category_model(cls, category) -> "EvaluationCategorySummary":
-        """Create EvaluationCategorySummary from EvaluationCategory model."""
-        return cls(
+    def from_evaluation_category_model(cls, category, aspects_count: int = 0) -> "EvaluationCategorySummary":
+        """Create EvaluationCategorySummary from EvaluationCategory model (trusted row, no validation)."""
+        return cls.model_construct(
             id=category.id,
             name=category.name,
             display_order=category.display_order,
             is_active=category.is_active,
-            aspects_count=getattr(category, 'aspects_count', 0)
+            aspects_count=aspects_count
         )
     
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
 
 # ===== ORDERING SCHEMAS =====
@@ -121,30 +147,42 @@ class CategoryOrderUpdate(BaseModel):
 
 class CategoriesReorder(BaseModel):
     """Schema for reordering multiple categories."""
-    category_orders: dict[int, int] = Field(..., description="Mapping of category_id to new_order")
+    category_ids: List[int] = Field(..., min_length=1, description="Category IDs to reorder")
+    new_orders: List[int] = Field(..., min_length=1, description="New display order for each category ID, by position")
+    
+    @model_validator(mode='after')
+    def validate_pairs(self) -> "CategoriesReorder":
+        """Ensure every category ID has exactly one new order."""
+        if len(self.category_ids) != len(self.new_orders):
+            raise ValueError("category_ids and new_orders must have the same length")
+        if len(set(self.category_ids)) != len(self.category_ids):
+            raise ValueError("Each category may only appear once in category_ids")
+        return self
+    
+    def as_mapping(self) -> Dict[int, int]:
+        """Return the reorder request as a category_id -> new_order mapping."""
+        return dict(zip(self.category_ids, self.new_orders))
 
 
 # ===== FILTER SCHEMAS =====
 
-class EvaluationCategoryFilterParams(BaseModel):
+class EvaluationCategoryFilterParams(PaginationParams, SearchParams):
     """Filter parameters for evaluation category listing."""
-    page: int = Field(default=1, ge=1, description="Page number")
-    size: int = Field(default=10, ge=1, le=100, description="Items per page")
     q: Optional[str] = Field(None, description="Search in category name or description")
     is_active: Optional[bool] = Field(None, description="Filter by active status")
     sort_by: str = Field(default="display_order", description="Sort field (name, display_order, is_active, created_at)")
-    sort_order: str = Field(default="asc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: SortOrder = Field(default="asc", description="Sort order")
 
 
 # ===== BULK OPERATIONS =====
 
 class EvaluationCategoryBulkUpdate(BaseModel):
     """Schema for bulk category updates."""
-    category_ids: List[int] = Field(..., min_items=1, description="List of category IDs to update")
+    category_ids: _BulkCategoryIds = Field(..., description="Set of category IDs to update")
     is_active: Optional[bool] = None
 
 
 class EvaluationCategoryBulkDelete(BaseModel):
     """Schema for bulk category deletion."""
-    category_ids: List[int] = Field(..., min_items=1, description="List of category IDs to delete")
+    category_ids: _BulkCategoryIds = Field(..., description="Set of category IDs to delete")
     force_delete: bool = Field(default=False, description="Force delete even if category has aspects")
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""Base filter schemas shared by listing endpoints.
+
+Query strings are validated once, when FastAPI builds the filter object for
+an endpoint. Code that rebuilds a filter from values that already passed
+validation (narrowing an existing filter, service-side defaults) should use
+``construct_trusted`` or ``model_copy(update=...)``, both of which skip
+field validation.
+"""
+
+from typing import Any, Optional
+from datetime import date
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas.shared import SortOrder
+
+
+class _FilterBase(BaseModel):
+    """Common configuration for filter parameter models."""
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
+    @classmethod
+    def construct_trusted(cls, **values: Any):
+        """Build a filter from already-validated values without re-validating."""
+        return cls.model_construct(**values)
+
+
+class PaginationParams(_FilterBase):
+    """Base pagination parameters."""
+    
+    page: int = Field(default=1, ge=1, description="Page number")
+    size: int = Field(default=10, ge=1, le=100, description="Items per page")
+
+
+class SearchParams(_FilterBase):
+    """Base search parameters."""
+    
+    q: Optional[str] = Field(default=None, description="Search query")
+    sort_by: str = Field(default="created_at", description="Sort field")
+    sort_order: SortOrder = Field(default="desc", description="Sort order")
+
+
+class DateRangeFilter(_FilterBase):
+    """Date range filter parameters."""
+    
+    start_date: Optional[date] = Field(default=None, description="Start date")
+    end_date: Optional[date] = Field(default=None, description="End date")
@@ -2,8 +2,9 @@
 
 from typing import Optional, List
 from pydantic import BaseModel, Field, ConfigDict, field_validator
+from datetime import datetime
 
-from src.schemas.shared import BaseListResponse
+from src.schemas.shared import BaseListResponse, SortOrder
 
 
 # ===== BASE SCHEMAS =====
@@ -66,8 +67,8 @@ class GalleryResponse(BaseModel):
     title: str
     excerpt: Optional[str] = None
     is_highlight: bool
-    created_at: str
-    updated_at: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
     created_by: Optional[int] = None
     updated_by: Optional[int] = None
     
@@ -77,18 +78,7 @@ class GalleryResponse(BaseModel):
     @classmethod
     def from_gallery_model(cls, gallery) -> "GalleryResponse":
         """Create GalleryResponse from Gallery model."""
-        return cls(
-            id=gallery.id,
-            img_url=gallery.img_url,
-            title=gallery.title,
-            excerpt=gallery.excerpt,
-            is_highlight=gallery.is_highlight,
-            created_at=gallery.created_at.isoformat() if gallery.created_at else "",
-            updated_at=gallery.updated_at.isoformat() if gallery.updated_at else None,
-            created_by=gallery.created_by,
-            updated_by=gallery.updated_by,
-            short_excerpt=gallery.short_excerpt
-        )
+        return cls.model_validate(gallery)
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -108,12 +98,7 @@ class GallerySummary(BaseModel):
     @classmethod
     def from_gallery_model(cls, gallery) -> "GallerySummary":
         """Create GallerySummary from Gallery model."""
-        return cls(
-            id=gallery.id,
-            img_url=gallery.img_url,
-            title=gallery.title,
-            is_highlight=gallery.is_highlight
-        )
+        return cls.model_validate(gallery)
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -133,6 +118,8 @@ class GalleryFilterParams(BaseModel):
     
     # Sorting
     sort_by: str = Field(default="created_at", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: SortOrder = Field(default="desc", description="Sort order")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
@@ -5,9 +5,7 @@ from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 
 from src.schemas.shared import BaseListResponse
-from typing import Optional
-from datetime import date
-from pydantic import Field
+from src.schemas.filters import PaginationParams, SearchParams, DateRangeFilter
 
 
 # ===== BASE SCHEMAS =====
@@ -185,30 +183,6 @@ class MediaFileSummary(BaseModel):
     model_config = {"from_attributes": True}
 
 
-# ===== BASE FILTER SCHEMAS =====
-
-class PaginationParams(BaseModel):
-    """Base pagination parameters."""
-    
-    page: int = Field(default=1, ge=1, description="Page number")
-    size: int = Field(default=10, ge=1, le=100, description="Items per page")
-
-
-class SearchParams(BaseModel):
-    """Base search parameters."""
-    
-    q: Optional[str] = Field(default=None, description="Search query")
-    sort_by: str = Field(default="created_at", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
-
-
-class DateRangeFilter(BaseModel):
-    """Date range filter parameters."""
-    
-    start_date: Optional[date] = Field(default=None, description="Start date")
-    end_date: Optional[date] = Field(default=None, description="End date")
-
-
 # ===== FILTER SCHEMAS =====
 
 class MediaFileFilterParams(PaginationParams, SearchParams, DateRangeFilter):
@@ -243,13 +217,13 @@ class FileUrlResponse(BaseModel):
 
 class FileBulkDelete(BaseModel):
     """Schema for bulk file deletion."""
-    file_ids: List[int] = Field(..., min_items=1, description="List of file IDs to delete")
+    file_ids: List[int] = Field(..., min_length=1, max_length=1000, description="List of file IDs to delete")
     force_delete: bool = Field(default=False, description="Force delete even if file has dependencies")
 
 
 class FileBulkUpdate(BaseModel):
     """Schema for bulk file updates."""
-    file_ids: List[int] = Field(..., min_items=1, description="List of file IDs to update")
+    file_ids: List[int] = Field(..., min_length=1, max_length=1000, description="List of file IDs to update")
     is_public: Optional[bool] = None
     organization_id: Optional[int] = None
 
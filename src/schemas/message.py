@@ -6,12 +6,20 @@ from datetime import datetime
 import re
 import html
 
-from src.schemas.shared import BaseListResponse
+from src.schemas.shared import BaseListResponse, SortOrder
 from src.models.message import MessageStatus
 
 
 # ===== SANITIZATION UTILITIES =====
 
+# Compiled once; the sanitizers run on every field of every submitted message
+_WHITESPACE_RE = re.compile(r'\s+')
+_LINE_BREAK_RE = re.compile(r'\r\n|\r|\n')
+_CARRIAGE_RETURN_RE = re.compile(r'\r\n|\r')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
 class SanitizationMixin:
     """Mixin for input sanitization methods."""
     
@@ -28,11 +36,11 @@ class SanitizationMixin:
         text = html.escape(text)
         
         # Remove excessive whitespace and normalize line breaks
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'\r\n|\r|\n', '\n', text)
+        text = _WHITESPACE_RE.sub(' ', text)
+        text = _LINE_BREAK_RE.sub('\n', text)
         
         # Remove any remaining HTML tags (in case they slipped through)
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         return text
     
@@ -49,13 +57,13 @@ class SanitizationMixin:
         text = html.escape(text)
         
         # Normalize line breaks but preserve structure
-        text = re.sub(r'\r\n|\r', '\n', text)
+        text = _CARRIAGE_RETURN_RE.sub('\n', text)
         
         # Remove excessive blank lines (more than 2 consecutive)
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
         
         # Remove any HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         return text
 
@@ -231,7 +239,9 @@ class MessageFilterParams(BaseModel):
     
     # Sorting
     sort_by: str = Field(default="created_at", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: SortOrder = Field(default="desc", description="Sort order")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 # ===== STATISTICS SCHEMAS =====
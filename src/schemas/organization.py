@@ -6,9 +6,7 @@ from datetime import datetime
 
 # Remove OrganizationType import as it's no longer needed
 from src.schemas.shared import BaseListResponse
-from typing import Optional
-from datetime import date
-from pydantic import Field
+from src.schemas.filters import PaginationParams, SearchParams, DateRangeFilter
 
 
 # ===== BASE SCHEMAS =====
@@ -125,30 +123,6 @@ class OrganizationSummary(BaseModel):
     model_config = {"from_attributes": True}
 
 
-# ===== BASE FILTER SCHEMAS =====
-
-class PaginationParams(BaseModel):
-    """Base pagination parameters."""
-    
-    page: int = Field(default=1, ge=1, description="Page number")
-    size: int = Field(default=10, ge=1, le=100, description="Items per page")
-
-
-class SearchParams(BaseModel):
-    """Base search parameters."""
-    
-    q: Optional[str] = Field(default=None, description="Search query")
-    sort_by: str = Field(default="display_order", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
-
-
-class DateRangeFilter(BaseModel):
-    """Date range filter parameters."""
-    
-    start_date: Optional[date] = Field(default=None, description="Start date")
-    end_date: Optional[date] = Field(default=None, description="End date")
-
-
 # ===== FILTER SCHEMAS =====
 
 class OrganizationFilterParams(PaginationParams, SearchParams, DateRangeFilter):
@@ -160,6 +134,9 @@ class OrganizationFilterParams(PaginationParams, SearchParams, DateRangeFilter):
     
     # Override search field description
     q: Optional[str] = Field(None, description="Search in name or description")
+    
+    # Override default sort
+    sort_by: str = Field(default="display_order", description="Sort field")
 
 
 # ===== HEAD ASSIGNMENT =====
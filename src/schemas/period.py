@@ -2,7 +2,7 @@
 
 from typing import Optional
 from datetime import date, datetime
-from pydantic import BaseModel, validator, Field
+from pydantic import BaseModel, ConfigDict, validator, Field
 
 from .shared import BaseListResponse
 
@@ -86,6 +86,8 @@ class PeriodFilter(BaseModel):
     start_date_to: Optional[date] = None
     end_date_from: Optional[date] = None
     end_date_to: Optional[date] = None
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class PeriodListResponse(BaseListResponse[PeriodResponse]):
@@ -56,4 +56,6 @@ class ProgramFilterParams(BaseModel):
     limit: int = Field(default=100, ge=1, le=1000, description="Number of items to return")
     
     # Search
-    search: Optional[str] = Field(default=None, description="Search in title, excerpt, or description")
\ No newline at end of file
+    search: Optional[str] = Field(default=None, description="Search in title, excerpt, or description")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
\ No newline at end of file
@@ -199,6 +199,8 @@ class RPPSubmissionFilter(BaseModel):
     submitted_before: Optional[datetime] = None
     reviewed_after: Optional[datetime] = None
     reviewed_before: Optional[datetime] = None
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class RPPSubmissionItemFilter(BaseModel):
@@ -207,6 +209,8 @@ class RPPSubmissionItemFilter(BaseModel):
     period_id: Optional[int] = None
     is_uploaded: Optional[bool] = None
     organization_id: Optional[int] = None  # For filtering by organization
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 # ===== STATISTICS SCHEMAS =====
@@ -1,9 +1,17 @@
 """Shared schemas for API responses."""
 
-from typing import List, Optional, TypeVar, Generic
+from functools import lru_cache
+from typing import Any, List, Literal, Optional, Type, TypeVar, Generic
 from pydantic import BaseModel, Field
 
 T = TypeVar('T')
+M = TypeVar('M', bound=BaseModel)
+
+# Field patterns shared by every schema module so the rules cannot drift
+SLUG_PATTERN = r'^[a-z0-9-]+$'
+
+# Closed choice validated by pydantic-core's literal validator, no regex
+SortOrder = Literal["asc", "desc"]
 
 
 class BaseResponse(BaseModel):
@@ -71,4 +79,14 @@ class ValidationErrorResponse(BaseModel):
     """Validation error response."""
     
     error: str = Field(default="Validation Error", description="Error type")
-    details: List[ValidationErrorDetail] = Field(..., description="Validation error details")
\ No newline at end of file
+    details: List[ValidationErrorDetail] = Field(..., description="Validation error details")
+
+
+@lru_cache(maxsize=1024)
+def cached_filter_params(model: Type[M], **params: Any) -> M:
+    """Build filter params, reusing the instance for repeated query strings.
+
+    Only use with frozen filter models: the returned instance is shared
+    between requests.
+    """
+    return model(**params)
@@ -1,9 +1,11 @@
 """Statistic schemas for request/response validation."""
 
 from typing import Optional, List
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from datetime import datetime
 
+from src.schemas.shared import SortOrder
+
 
 class StatisticBase(BaseModel):
     """Base statistic schema."""
@@ -59,9 +61,11 @@ class StatisticFilterParams(BaseModel):
     """Schema for statistic filtering parameters."""
     search: Optional[str] = Field(None, description="Search term for title, description, or stats")
     sort_by: str = Field("display_order", description="Sort field")
-    sort_order: str = Field("asc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: SortOrder = Field("asc", description="Sort order")
     page: int = Field(1, ge=1, description="Page number")
     size: int = Field(10, ge=1, le=100, description="Page size")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     @validator('sort_by')
     def validate_sort_by(cls, v):
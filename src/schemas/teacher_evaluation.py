@@ -162,6 +162,8 @@ class TeacherEvaluationFilterParams(PaginationParams):
     has_final_notes: Optional[bool] = Field(None, description="Filter by presence of final notes")
     from_date: Optional[datetime] = Field(None, description="Filter from last updated date")
     to_date: Optional[datetime] = Field(None, description="Filter to last updated date")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class AssignTeachersToEvaluationPeriod(BaseModel):
@@ -1,11 +1,17 @@
 """Updated user schemas for unified schema."""
 
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any
 from pydantic import BaseModel, EmailStr, ConfigDict, field_validator, Field
 from datetime import datetime, date
 
 from src.models.enums import UserStatus, UserRole
-from src.schemas.shared import BaseListResponse, MessageResponse
+from src.schemas.shared import BaseListResponse, MessageResponse, SortOrder
+
+
+# Wire-side values of UserRole/UserStatus for query filters; validated as
+# literals in pydantic-core and converted back to the enums in the repository
+UserRoleFilter = Literal["SUPER_ADMIN", "ADMIN", "GURU", "KEPALA_SEKOLAH"]
+UserStatusFilter = Literal["active", "inactive", "suspended"]
 
 
 # ===== BASE SCHEMAS =====
@@ -138,7 +144,9 @@ class UserResponse(BaseModel):
 
 class UserListResponse(BaseListResponse[UserResponse]):
     """Standardized user list response."""
-    pass
+    total: Optional[int] = Field(..., description="Total number of items (null when paging by cursor)")
+    pages: Optional[int] = Field(..., description="Total number of pages (null when paging by cursor)")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page, if any")
 
 
 class UserSummary(BaseModel):
@@ -204,30 +212,6 @@ class PasswordResetConfirm(BaseModel):
 
 
 
-# ===== BASE FILTER SCHEMAS =====
-
-class PaginationParams(BaseModel):
-    """Base pagination parameters."""
-    
-    page: int = Field(default=1, ge=1, description="Page number")
-    size: int = Field(default=10, ge=1, le=100, description="Items per page")
-
-
-class SearchParams(BaseModel):
-    """Base search parameters."""
-    
-    q: Optional[str] = Field(default=None, description="Search query")
-    sort_by: str = Field(default="created_at", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
-
-
-class DateRangeFilter(BaseModel):
-    """Date range filter parameters."""
-    
-    start_date: Optional[date] = Field(default=None, description="Start date")
-    end_date: Optional[date] = Field(default=None, description="End date")
-
-
 # ===== USER FILTER SCHEMAS =====
 
 class UserFilterParams(BaseModel):
@@ -239,13 +223,13 @@ class UserFilterParams(BaseModel):
     
     # Search and filtering
     search: Optional[str] = Field(default=None, description="Search in name, email, or username")
-    role: Optional[UserRole] = Field(default=None, description="Filter by user role")
-    status: Optional[UserStatus] = Field(default=None, description="Filter by user status")
+    role: Optional[UserRoleFilter] = Field(default=None, description="Filter by user role")
+    status: Optional[UserStatusFilter] = Field(default=None, description="Filter by user status")
     organization_id: Optional[int] = Field(default=None, description="Filter by organization")
     
     # Sorting
     sort_by: str = Field(default="created_at", description="Sort field")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: SortOrder = Field(default="desc", description="Sort order")
     
     # Date filtering
     created_after: Optional[date] = Field(default=None, description="Filter users created after this date")
@@ -254,6 +238,14 @@ class UserFilterParams(BaseModel):
     # Active/inactive filter
     is_active: Optional[bool] = Field(default=None, description="Filter by active status")
 
+    # Keyset pagination
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor from a previous response's next_cursor; replaces page and skips the total count"
+    )
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class UsernameGenerationPreview(BaseModel):
     """Preview data for username generation."""
@@ -180,7 +180,7 @@ class ArticleService:
     
     async def get_article_summaries(self, filters: ArticleFilterParams) -> List[ArticleSummary]:
         """Get article summaries (lighter response)."""
-        articles, _ = await self.article_repo.get_all_filtered(filters)
+        articles = await self.article_repo.get_summaries_filtered(filters)
         return [ArticleSummary.from_article_model(article) for article in articles]
     
     async def duplicate_article(self, article_id: int, new_title: Optional[str] = None, new_slug: Optional[str] = None, created_by: Optional[int] = None) -> ArticleResponse:
@@ -256,9 +256,11 @@ class AuthService:
         # Update password
         new_hashed_password = get_password_hash(reset_data.new_password)
         
+        # Consume the token and update the password in a single transaction
         try:
-            await self.user_repo.update_password(user.id, new_hashed_password)
-            logger.info(f"Password updated successfully for user: {user.full_name} ({mask_email(user.email)})")
+            password_reset = await self.user_repo.reset_password_with_token(
+                user.id, new_hashed_password, reset_token.id
+            )
         except Exception as e:
             logger.error(f"Failed to update password for user {user.full_name}: {str(e)}")
             raise HTTPException(
@@ -266,12 +268,15 @@ class AuthService:
                 detail="Failed to update password. Please try again."
             )
         
-        # Mark token as used
-        try:
-            await self.user_repo.mark_token_as_used(reset_token.id)
-            logger.info(f"Reset token marked as used: {reset_data.token[:8]}...")
-        except Exception as e:
-            logger.error(f"Failed to mark reset token as used: {str(e)}")
+        if not password_reset:
+            logger.error("Cannot use same url for reset password")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Tidak bisa pakai link yang sudah dipakai"
+            )
+        
+        logger.info(f"Password updated successfully for user: {user.full_name} ({mask_email(user.email)})")
+        logger.info(f"Reset token marked as used: {reset_data.token[:8]}...")
         
         # Send success confirmation email
         if user.email:
@@ -16,6 +16,10 @@ from src.schemas.dashboard import (
     TeacherEvaluationDashboardStats,
     OrganizationSummary,
     PeriodSummary,
+    OrganizationOverview,
+    TeacherSummary,
+    SystemOverview,
+    SystemActivity,
     TeacherDashboard,
     PrincipalDashboard,
     AdminDashboard
@@ -456,85 +460,88 @@ class DashboardService:
         organizations = await self.org_repo.get_all()
         summaries = []
         
+        # Count teachers for every organization in a single grouped query
+        teacher_counts = await self.user_repo.get_teachers_count_by_organizations(
+            [org.id for org in organizations]
+        )
+        
         for org in organizations:
             rpp_stats = await self._get_organization_rpp_stats(org.id, period_id)
             eval_stats = await self._get_organization_evaluation_stats(org.id, period_id)
             
-            # Count teachers in organization using user repository
-            teacher_count = await self.user_repo.get_teachers_count_by_organization(org.id)
-            
             summaries.append(OrganizationSummary(
                 organization_id=org.id,
                 organization_name=org.name,
-                total_teachers=teacher_count,
+                total_teachers=teacher_counts[org.id],
                 rpp_stats=rpp_stats,
                 evaluation_stats=eval_stats
             ))
         
         return summaries
     
-    async def _get_organization_overview(self, org_id: int, period_id: Optional[int]) -> Dict[str, Any]:
+    async def _get_organization_overview(self, org_id: int, period_id: Optional[int]) -> Optional[OrganizationOverview]:
         """Get detailed organization overview."""
         org = await self.org_repo.get_by_id(org_id)
         if not org:
-            return {}
+            return None
         
         # Get teacher count using user repository
         teacher_count = await self.user_repo.get_teachers_count_by_organization(org_id)
         
-        return {
-            "organization_name": org.name,
-            "total_teachers": teacher_count,
-            "active_teachers": teacher_count,  # Simplified - assume all are active
-            "head_name": org.head.profile.get('full_name') if org.head and org.head.profile else "No head assigned"
-        }
+        return OrganizationOverview(
+            organization_name=org.name,
+            total_teachers=teacher_count,
+            active_teachers=teacher_count,  # Simplified - assume all are active
+            head_name=(org.head.full_name if org.head else "") or "No head assigned"
+        )
     
-    async def _get_organization_teacher_summaries(self, org_id: int, period_id: Optional[int]) -> List[Dict[str, Any]]:
+    async def _get_organization_teacher_summaries(self, org_id: int, period_id: Optional[int]) -> List[TeacherSummary]:
         """Get teacher summaries for an organization."""
         # Get all teachers in the organization
         teachers = await self.user_repo.get_teachers_by_organization(org_id)
         
         summaries = []
         for teacher in teachers[:10]:  # Limit to top 10 for performance
+            teacher_name = teacher.full_name or teacher.email
             try:
                 rpp_progress = await self.rpp_repo.get_teacher_progress(teacher.id)
                 
-                summaries.append({
-                    "teacher_id": teacher.id,
-                    "teacher_name": teacher.profile.get('full_name', teacher.email) if teacher.profile else teacher.email,
-                    "total_rpps": rpp_progress["total_submitted"],
-                    "approved_rpps": rpp_progress["approved"],
-                    "completion_rate": rpp_progress["completion_rate"]
-                })
+                summaries.append(TeacherSummary(
+                    teacher_id=teacher.id,
+                    teacher_name=teacher_name,
+                    total_rpps=rpp_progress["total_submitted"],
+                    approved_rpps=rpp_progress["approved"],
+                    completion_rate=rpp_progress["completion_rate"]
+                ))
             except:
                 # If we can't get RPP progress, still include the teacher with zero stats
-                summaries.append({
-                    "teacher_id": teacher.id,
-                    "teacher_name": teacher.profile.get('full_name', teacher.email) if teacher.profile else teacher.email,
-                    "total_rpps": 0,
-                    "approved_rpps": 0,
-                    "completion_rate": 0.0
-                })
+                summaries.append(TeacherSummary(
+                    teacher_id=teacher.id,
+                    teacher_name=teacher_name,
+                    total_rpps=0,
+                    approved_rpps=0,
+                    completion_rate=0.0
+                ))
         
         return summaries
     
-    async def _get_system_overview(self, period_id: Optional[int]) -> Dict[str, Any]:
+    async def _get_system_overview(self, period_id: Optional[int]) -> SystemOverview:
         """Get system-wide overview."""
         # Get total counts using repository methods
         total_users = await self.user_repo.get_user_count()
         total_orgs = await self.org_repo.get_organization_count()
         
-        return {
-            "total_users": total_users,
-            "total_organizations": total_orgs,
-            "system_health": "good"  # This could be calculated based on various metrics
-        }
+        return SystemOverview(
+            total_users=total_users,
+            total_organizations=total_orgs,
+            system_health="good"  # This could be calculated based on various metrics
+        )
     
-    async def _get_recent_system_activities(self) -> List[Dict[str, Any]]:
+    async def _get_recent_system_activities(self) -> List[SystemActivity]:
         """Get recent system activities."""
         return [
-            {"type": "system_overview", "message": "System running normally"},
-            {"type": "data_summary", "message": "Dashboard data refreshed"}
+            SystemActivity(type="system_overview", message="System running normally"),
+            SystemActivity(type="data_summary", message="Dashboard data refreshed")
         ]
     
     async def _get_organization_distribution(self, period_id: Optional[int]) -> Dict[str, Dict[str, int]]:
@@ -12,12 +12,13 @@ from src.schemas.evaluation_aspect import (
     EvaluationAspectUpdate,
     EvaluationAspectResponse,
     EvaluationAspectListResponse,
-    EvaluationAspectSummary,
     EvaluationAspectBulkCreate,
     EvaluationAspectBulkUpdate,
     EvaluationAspectBulkDelete,
     EvaluationAspectAnalytics,
     AspectPerformanceAnalysis,
+    AspectUsageEntry,
+    GradeDistribution,
     EvaluationAspectStats,
     AspectOrderUpdate,
     CategoryAspectsReorder,
@@ -67,7 +68,7 @@ class EvaluationAspectService:
                 await self.evaluation_repo.recalculate_all_aggregates()
            
         
-        return EvaluationAspectResponse.from_evaluation_aspect_model(aspect, include_stats=True)
+        return EvaluationAspectResponse.from_evaluation_aspect_model(aspect)
     
     async def get_aspect_by_id(self, aspect_id: int) -> EvaluationAspectResponse:
         """Get evaluation aspect by ID."""
@@ -81,14 +82,9 @@ class EvaluationAspectService:
         # Get statistics
         stats = await self.aspect_repo.get_aspect_statistics(aspect_id)
         
-        response = EvaluationAspectResponse.from_evaluation_aspect_model(
-            aspect, include_stats=True
+        return EvaluationAspectResponse.from_evaluation_aspect_model(
+            aspect, evaluation_count=stats["evaluation_count"]
         )
-        
-        # Add statistics
-        response.evaluation_count = stats["evaluation_count"]
-        
-        return response
     
     async def update_aspect(
         self, 
@@ -133,7 +129,7 @@ class EvaluationAspectService:
                 if items_deleted > 0 and self.evaluation_repo:
                     await self.evaluation_repo.recalculate_all_aggregates()
              
-        return EvaluationAspectResponse.from_evaluation_aspect_model(updated_aspect, include_stats=True)
+        return EvaluationAspectResponse.from_evaluation_aspect_model(updated_aspect)
     
     async def delete_aspect(self, aspect_id: int) -> MessageResponse:
         """Delete evaluation aspect with auto-sync."""
@@ -221,23 +217,14 @@ class EvaluationAspectService:
         """Get evaluation aspects with filters and pagination."""
         aspects, total = await self.aspect_repo.get_all_aspects_filtered(filters)
         
-        # Convert to response objects
-        aspect_responses = []
-        for aspect in aspects:
-            # Get statistics if needed
-            stats = {}
-            if filters.q or hasattr(filters, 'include_stats'):
-                stats = await self.aspect_repo.get_aspect_statistics(aspect.id)
-            
-            response = EvaluationAspectResponse.from_evaluation_aspect_model(
-                aspect, include_stats=bool(stats)
+        # One grouped count for the whole page instead of a query per aspect
+        evaluation_counts = await self.aspect_repo.get_evaluation_counts([aspect.id for aspect in aspects])
+        aspect_responses = [
+            EvaluationAspectResponse.from_evaluation_aspect_model(
+                aspect, evaluation_count=evaluation_counts.get(aspect.id, 0)
             )
-            
-            if stats:
-                response.evaluation_count = stats["evaluation_count"]
-                response.avg_score = stats["avg_score"]
-            
-            aspect_responses.append(response)
+            for aspect in aspects
+        ]
         
         return EvaluationAspectListResponse(
             items=aspect_responses,
@@ -247,24 +234,24 @@ class EvaluationAspectService:
             pages=(total + filters.size - 1) // filters.size
         )
     
-    async def get_active_aspects(self) -> List[EvaluationAspectSummary]:
+    async def get_active_aspects(self) -> List[EvaluationAspectResponse]:
         """Get all active evaluation aspects."""
         aspects = await self.aspect_repo.get_active_aspects()
         
         return [
-            EvaluationAspectSummary.from_evaluation_aspect_model(aspect)
+            EvaluationAspectResponse.from_evaluation_aspect_model(aspect)
             for aspect in aspects
         ]
     
     async def get_aspects_by_category(
         self, 
         category_id: int
-    ) -> List[EvaluationAspectSummary]:
+    ) -> List[EvaluationAspectResponse]:
         """Get aspects by category ID."""
         aspects = await self.aspect_repo.get_aspects_by_category(category_id)
         
         return [
-            EvaluationAspectSummary.from_evaluation_aspect_model(aspect)
+            EvaluationAspectResponse.from_evaluation_aspect_model(aspect)
             for aspect in aspects
         ]
     
@@ -291,7 +278,7 @@ class EvaluationAspectService:
         aspects = await self.aspect_repo.bulk_create(bulk_data.aspects, created_by)
         
         return [
-            EvaluationAspectResponse.from_evaluation_aspect_model(aspect, include_stats=True)
+            EvaluationAspectResponse.from_evaluation_aspect_model(aspect)
             for aspect in aspects
         ]
     
@@ -367,12 +354,12 @@ class EvaluationAspectService:
         for aspect in aspects[:10]:  # Limit to top 10
             stats = await self.aspect_repo.get_aspect_statistics(aspect.id)
             
-            aspect_info = {
-                "aspect_id": aspect.id,
-                "aspect_name": aspect.aspect_name,
-                "evaluation_count": stats["evaluation_count"],
-                "avg_score": stats.get("avg_score", 0)
-            }
+            aspect_info = AspectUsageEntry(
+                aspect_id=aspect.id,
+                aspect_name=aspect.aspect_name,
+                evaluation_count=stats["evaluation_count"],
+                avg_score=stats.get("avg_score", 0)
+            )
             
             if stats["evaluation_count"] > 0:
                 most_used.append(aspect_info)
@@ -381,8 +368,8 @@ class EvaluationAspectService:
                 least_used.append(aspect_info)
         
         # Sort by usage
-        most_used.sort(key=lambda x: x["evaluation_count"], reverse=True)
-        least_used.sort(key=lambda x: x["evaluation_count"])
+        most_used.sort(key=lambda x: x.evaluation_count, reverse=True)
+        least_used.sort(key=lambda x: x.evaluation_count)
         
         return EvaluationAspectAnalytics(
             total_aspects=analytics_data["total_aspects"],
@@ -412,7 +399,7 @@ class EvaluationAspectService:
                     aspect_name=aspect.aspect_name,
                     total_evaluations=stats["evaluation_count"],
                     avg_grade="C",  # Default, would need grade calculation
-                    grade_distribution={},  # Would need grade distribution logic
+                    grade_distribution=GradeDistribution(),  # Would need grade distribution logic
                     trend_data=[],  # Would need time-series data
                     top_performers=[],  # Would need teacher performance data
                     improvement_needed=[]  # Would need teacher performance data
@@ -427,7 +414,7 @@ class EvaluationAspectService:
         if analytics.inactive_aspects > 0:
             recommendations.append(f"Review {analytics.inactive_aspects} inactive aspects")
         
-        if len([a for a in analytics.most_used_aspects if a["evaluation_count"] == 0]) > 0:
+        if len([a for a in analytics.most_used_aspects if a.evaluation_count == 0]) > 0:
             recommendations.append("Some aspects have never been used in evaluations")
         
         return EvaluationAspectStats(
@@ -470,7 +457,7 @@ class EvaluationAspectService:
             created_by=created_by
         )
         
-        return EvaluationCategoryResponse.from_evaluation_category_model(category, include_stats=True)
+        return EvaluationCategoryResponse.from_evaluation_category_model(category)
     
     async def update_category(self, category_id: int, category_data: EvaluationCategoryUpdate, updated_by: int) -> EvaluationCategoryResponse:
         """Update an evaluation category."""
@@ -499,7 +486,7 @@ class EvaluationAspectService:
                 detail="Failed to update category"
             )
         
-        return EvaluationCategoryResponse.from_evaluation_category_model(updated_category, include_stats=True)
+        return EvaluationCategoryResponse.from_evaluation_category_model(updated_category)
     
     async def delete_category(self, category_id: int) -> MessageResponse:
         """Delete evaluation category with cascade deletion of all associated aspects."""
@@ -611,7 +598,7 @@ class EvaluationAspectService:
             )
         
         # Validate that all aspect IDs belong to the specified category
-        for aspect_id in reorder_data.aspect_orders.keys():
+        for aspect_id, _ in reorder_data.aspect_orders:
             aspect = await self.aspect_repo.get_by_id(aspect_id)
             if not aspect:
                 raise HTTPException(
@@ -172,7 +172,7 @@ class MediaFileService:
         
         # Add organization filter if provided
         if organization_id:
-            filters.organization_id = organization_id
+            filters = filters.model_copy(update={"organization_id": organization_id})
         
         media_files, total_count = await self.media_file_repo.get_all_files_filtered(filters)
         
@@ -377,7 +377,7 @@ class MediaFileService:
         """Get files uploaded by specific user."""
         
         # Set uploader filter
-        filters.uploader_id = uploader_id
+        filters = filters.model_copy(update={"uploader_id": uploader_id})
         
         return await self.list_files(filters)
     
@@ -385,7 +385,7 @@ class MediaFileService:
         """Get public files only."""
         
         # Set public filter
-        filters.is_public = True
+        filters = filters.model_copy(update={"is_public": True})
         
         return await self.list_files(filters)
     
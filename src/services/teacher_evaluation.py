@@ -301,7 +301,7 @@ class TeacherEvaluationService:
                 pass  
             else:
                 # Guru can only see their own evaluations
-                filters.teacher_id = current_user["id"]
+                filters = filters.model_copy(update={"teacher_id": current_user["id"]})
 
         evaluations, total_count = await self.evaluation_repo.get_evaluations_filtered(
             filters, organization_id
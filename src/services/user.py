@@ -3,7 +3,7 @@
 from typing import Optional, List, Dict, Any, Union
 from fastapi import HTTPException, status
 
-from src.repositories.user import UserRepository
+from src.repositories.user import UserRepository, encode_user_cursor
 from src.schemas.user import (
     UserCreate, UserUpdate, AdminUserUpdate, UserResponse, UserListResponse, 
     UserChangePassword, UserSummary
@@ -38,17 +38,14 @@ class UserService:
         #                 detail="Admin cannot create other Admin or Super Admin accounts"
         #             )
         
-        # Validate email uniqueness
-        existing_user = await self.user_repo.get_by_email(user_data.email)
-        if existing_user:
+        # Create user in database; None means the email is already taken
+        user = await self.user_repo.create(user_data, organization_id)
+        if not user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=get_message("user", "email_exists")
             )
         
-        # Create user in database
-        user = await self.user_repo.create(user_data, organization_id)
-        
         # Convert to response with role
         user_role = self._get_user_role(user)
         return UserResponse.from_user_model(user, user_role)
@@ -94,8 +91,7 @@ class UserService:
         
         # Validate email uniqueness if being updated
         if hasattr(user_data, 'email') and user_data.email:
-            existing_email_user = await self.user_repo.get_by_email(user_data.email)
-            if existing_email_user and existing_email_user.id != user_id:
+            if await self.user_repo.email_exists(user_data.email, exclude_user_id=user_id):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=get_message("user", "email_exists")
@@ -260,7 +256,13 @@ class UserService:
     async def get_all_users_with_filters(self, filters: UserFilterParams) -> UserListResponse:
         """Get users with filters and pagination."""
         # Get users from repository
-        users, total = await self.user_repo.search(filters)
+        try:
+            users, total = await self.user_repo.search(filters)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
                 
         # Convert to responses with role
         user_responses = []
@@ -268,14 +270,23 @@ class UserService:
             user_role = self._get_user_role(user)
             user_responses.append(UserResponse.from_user_model(user, user_role))
         
-        pages = (total + filters.size - 1) // filters.size if total > 0 else 0
+        # A full page means there may be more rows after it
+        next_cursor = None
+        if len(users) == filters.size:
+            next_cursor = encode_user_cursor(users[-1], filters.sort_by)
+
+        # Cursor pages skip the COUNT(*), so total and pages are unknown
+        pages = None
+        if total is not None:
+            pages = (total + filters.size - 1) // filters.size if total > 0 else 0
 
         return UserListResponse(
             items=user_responses,
             total=total,
             page=filters.page,
             size=filters.size,
-            pages=pages
+            pages=pages,
+            next_cursor=next_cursor
         )
     
     async def get_users_by_role(self, role_name: str) -> List[UserResponse]:
@@ -360,19 +371,15 @@ class UserService:
     
     async def update_user_profile_field(self, user_id: int, field_name: str, field_value: str) -> UserResponse:
         """Update specific field in user profile."""
-        user = await self.user_repo.get_by_id(user_id)
-        if not user:
+        # Merge the field into the stored profile with a single UPDATE
+        updated = await self.user_repo.update_profile_field(user_id, field_name, field_value)
+        if not updated:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=get_message("user", "not_found")
             )
         
-        # Update the specific field
-        user.update_profile_field(field_name, field_value)
-        
-        # Save changes
-        user_data = UserUpdate(profile=user.profile)
-        return await self._update_user_without_role_validation(user_id, user_data)
+        return await self.get_user(user_id)
     
     async def _validate_role_change(self, target_user_id: int, new_role: UserRole, current_user_id: int) -> None:
         """Validate role change restrictions."""
@@ -445,8 +452,7 @@ class UserService:
         # Check for email conflicts only if email is being updated
         if hasattr(user_data, 'email') and user_data.email:
             if user_data.email != existing_user.email:
-                existing_email_user = await self.user_repo.get_by_email(user_data.email)
-                if existing_email_user and existing_email_user.id != user_id:
+                if await self.user_repo.email_exists(user_data.email, exclude_user_id=user_id):
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=get_message("user", "email_exists")